@@ -0,0 +1,60 @@
+"""
+==========================================================
+Import Time Benchmark
+cold start import time of every entry point stage, each
+measured in a fresh interpreter with 'python -X importtime'
+and split by top-level package. The prediction path should
+only load numpy besides the standard library and fates.
+usage: python benchmarks/import_time.py [repeats]
+==========================================================
+"""
+import os
+import re
+import subprocess
+import sys
+
+repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+stages = {
+    'prediction': "import Proxy, fates.proxy",
+    'campaign': "import Screening, fates.campaign",
+    'screening analysis': "import Screening, fates.analysis",
+    'proxy GUI': "import Proxy, fates.proxy_gui",
+    'screening GUI': "import Screening, fates.screening_gui"
+}
+heavy_packages = ['gmsh', 'ogstools', 'pyvista', 'vtk', 'vtuIO', 'ogs6py', 'openpyxl', 'doepy', 'seaborn',
+                  'statsmodels', 'sklearn', 'scipy', 'pandas', 'matplotlib', 'PyQt5']
+
+
+def import_times(code):
+    # Self import time in microseconds of every top-level package loaded by the code
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], cwd=repo, capture_output=True,
+                            text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+\d+ \|\s+(\S+)', line)
+        if match:
+            package = match.group(2).split('.')[0]
+            times[package] = times.get(package, 0) + int(match.group(1))
+    return times
+
+
+if __name__ == "__main__":
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for stage, code in stages.items():
+        try:
+            times = min((import_times(code) for _ in range(repeats)), key=lambda times: sum(times.values()))
+        except RuntimeError as error:
+            print(f"{stage:<20} not available here ({error})")
+            continue
+        total = sum(times.values()) / 1000
+        stdlib = sum(time for package, time in times.items() if package in sys.stdlib_module_names) / 1000
+        largest = sorted(((package, time) for package, time in times.items()
+                          if package not in sys.stdlib_module_names), key=lambda item: -item[1])[:4]
+        heavy = [package for package in heavy_packages if package in times]
+        print(f"{stage:<20} {total:7.1f} ms (standard library {stdlib:5.1f} ms), numpy "
+              f"{times.get('numpy', 0) / 1000 / (total - stdlib):4.0%} of the rest, largest: "
+              + ', '.join(f"{package} {time / 1000:.1f}" for package, time in largest)
+              + f", heavy packages: {', '.join(heavy) or 'none'}")
@@ -0,0 +1,20 @@
+"""
+==========================================================
+FATES
+Feasibility Assessment of Thermal Energy Storage. The
+library behind Screening.py and Proxy.py, importing it
+runs nothing:
+config          shared settings of a study
+design          screening designs
+preprocessing   meshes, prj files and initial conditions
+simulation      OGS runs, result extraction and cache
+postprocessing  energy balance and summary tables
+campaign        manifest and parallel campaign scheduler
+analysis        screening regression
+proxy           proxy models and batch prediction
+sampling        Monte Carlo input distributions
+statistics      streaming summaries of Monte Carlo results
+montecarlo      adaptive, chunked Monte Carlo simulation
+sensitivity     Sobol indices of the proxy models
+==========================================================
+"""
@@ -0,0 +1,47 @@
+"""
+==========================================================
+Statistical Analysis
+ordinary least squares regression of a response on all
+factors of the screening design, used to identify the
+heavy hitters for the desired response in a desired
+operational year
+==========================================================
+"""
+import numpy as np
+import pandas as pd
+
+from fates import config
+
+
+def response_column(response, year):
+    # Column of the summary table for 'Heat Recovery Factor' or 'Heat Production'
+    if response == "Heat Recovery Factor":
+        return f"HRF{year}"
+    return f"E_out{year} (Gwh)"
+
+
+def screening_regression(df, column_name):
+    # Fits the response column of the summary table on the design factors, returns the model and the response
+    import statsmodels.api as sm
+    import statsmodels.formula.api as smf
+    response_data = np.array(df.iloc[:, df.columns.get_loc(column_name)])
+    matrix_arr = df.iloc[:, 1:-45]
+    matrix_design = matrix_arr.to_numpy()
+    matrix_design = pd.DataFrame(matrix_design, columns=config.factors_list)
+    response = pd.DataFrame({'Response': response_data})
+    matrix_design = sm.add_constant(matrix_design)
+    matrix_design['Response'] = response
+    data = matrix_design
+
+    # Perform OLS regression
+    model = smf.ols(formula='response ~ ' + ' + '.join(config.factors_list), data=data).fit()
+    return model, response_data
+
+
+def critical_t_value(model, response_data, alpha=0.05):
+    # Two-sided critical t value of the standardized coefficients
+    from scipy.stats import t
+    obs = len(response_data)
+    pred = len(model.params) - 1
+    deg_free = obs - pred - 1
+    return t.ppf(1 - alpha / 2, deg_free)
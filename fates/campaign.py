@@ -0,0 +1,190 @@
+"""
+==========================================================
+Campaign
+'campaign.json' stores the design and the status of every
+experiment. When a campaign is restarted, the design is
+read back from the manifest, finished experiments are
+loaded from their stored results and only failed or
+missing ones are simulated again. An asyncio scheduler
+prepares the experiments in a pool of worker processes,
+runs at most 'n_workers' OGS instances and appends every
+finished experiment to 'summary.csv', which a new campaign
+starts empty. result.xlsx is rendered once at the end of
+the campaign.
+==========================================================
+"""
+import asyncio
+import csv
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from fates import config
+from fates.postprocessing import save_experiment, save_summary_table, summary_row
+from fates.preprocessing import build_mesh, make_run_context, prepare_experiment
+from fates.simulation import cache_key, cache_load, cache_report, cache_store, extract_results, simulate_experiment
+
+
+def load_manifest(build_design):
+    # The design is only built for a new campaign
+    manifest_path = os.path.join(config.directory, config.manifest_file)
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as file:
+            manifest = json.load(file)
+        print(f"Resuming campaign from {manifest_path}")
+        return manifest
+    manifest = {'design': json.loads(build_design().to_json(orient='split')), 'experiments': {}}
+    # The summary tables of an earlier campaign would mix its experiments with the ones of the new design, and
+    # load_summary reads its result.xlsx until the new campaign is rendered. The workbook is kept under another name
+    for name in [config.summary_file, config.summary_table]:
+        if os.path.exists(os.path.join(config.directory, name)):
+            os.remove(os.path.join(config.directory, name))
+    workbook_path = os.path.join(config.directory, 'result.xlsx')
+    if os.path.exists(workbook_path):
+        os.replace(workbook_path, os.path.join(config.directory, 'result_previous.xlsx'))
+    save_manifest(manifest)
+    return manifest
+
+
+def save_manifest(manifest):
+    manifest_path = os.path.join(config.directory, config.manifest_file)
+    with open(manifest_path + '.tmp', 'w') as file:
+        json.dump(manifest, file, indent=2)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+
+def is_completed(manifest, index):
+    experiment = manifest['experiments'].get(str(index), {})
+    return (experiment.get('status') == 'done'
+            and os.path.exists(os.path.join(config.directory, experiment['results'])))
+
+
+def save_run_results(context, output):
+    os.makedirs(context['folder'], exist_ok=True)
+    results_path = os.path.join(context['folder'], 'results.npz')
+    np.savez(results_path, **{key: np.asarray(value) for key, value in output.items()})
+    return os.path.relpath(results_path, config.directory)
+
+
+def load_run_results(results_file):
+    with np.load(os.path.join(config.directory, results_file)) as results:
+        return {key: results[key].tolist() for key in results.files}
+
+
+def summary_experiments():
+    # Experiments already appended to the summary table
+    summary_path = os.path.join(config.directory, config.summary_file)
+    if not os.path.exists(summary_path):
+        return set()
+    with open(summary_path, newline='') as file:
+        return {int(float(line[0])) for line in list(csv.reader(file))[1:] if line}
+
+
+def append_summary(values):
+    # Appends one experiment to the summary table and flushes it to disk
+    summary_path = os.path.join(config.directory, config.summary_file)
+    new_file = not os.path.exists(summary_path)
+    with open(summary_path, 'a', newline='') as file:
+        writer = csv.writer(file)
+        if new_file:
+            writer.writerow(config.result_columns)
+        writer.writerow(values)
+
+
+def render_workbook(manifest):
+    # ----------------------------------------------------
+    # Rendering result.xlsx From The Run Store
+    # one sheet per completed experiment, written only once
+    # ----------------------------------------------------
+    from openpyxl import Workbook
+    design = pd.DataFrame(**manifest['design'])
+    workbook = Workbook()
+    workbook.worksheets[0].append(config.result_columns)
+    rows = []
+    for index in sorted(int(index) for index in manifest['experiments']):
+        if is_completed(manifest, index):
+            output = load_run_results(manifest['experiments'][str(index)]['results'])
+            rows.append(save_experiment(workbook, index, design.loc[index], output))
+    save_summary_table(rows)
+    workbook.save(os.path.join(config.directory, 'result.xlsx'))
+    print(f"Results written to {os.path.join(config.directory, 'result.xlsx')}")
+
+
+mesh_builds = {}
+
+
+def prepare_mesh(mesh, executor):
+    # Experiments with the same geometry share one build
+    mesh_dir = os.path.join(config.directory, 'meshes',
+                            hashlib.sha256(json.dumps(mesh, sort_keys=True).encode()).hexdigest()[:16])
+    if mesh_dir not in mesh_builds:
+        mesh_builds[mesh_dir] = asyncio.get_running_loop().run_in_executor(executor, build_mesh, mesh, mesh_dir)
+    return mesh_builds[mesh_dir]
+
+
+async def run_experiment(index, row, study, executor, semaphore, manifest):
+    loop = asyncio.get_running_loop()
+    context = make_run_context(index)
+    manifest['experiments'][str(index)] = {'status': 'running'}
+    save_manifest(manifest)
+    parameters = study['resolve_parameters'](row)
+    key = cache_key(parameters)
+    output = cache_load(key)
+    if output is None:
+        mesh_dir = await prepare_mesh(parameters['mesh'], executor)
+        await loop.run_in_executor(executor, prepare_experiment, index, row, parameters, context, mesh_dir)
+        await simulate_experiment(index, context, semaphore)
+        output = await loop.run_in_executor(executor, extract_results, context, parameters['mesh'])
+        cache_store(key, output)
+    else:
+        print(f"Experiment {index}: loaded from the result cache")
+    output['inputs'] = study['design_values'](row)
+    manifest['experiments'][str(index)] = {'status': 'done', 'results': save_run_results(context, output)}
+    save_manifest(manifest)
+    return output
+
+
+async def run_campaign(experiments, study, manifest):
+    semaphore = asyncio.Semaphore(config.n_workers)
+    failed = []
+    # Completed experiments are not simulated again, their stored results are reused
+    stored = summary_experiments()
+    for index, row in experiments:
+        if is_completed(manifest, index) and index not in stored:
+            append_summary(summary_row(index, row, load_run_results(manifest['experiments'][str(index)]['results'])))
+    pending = [(index, row) for index, row in experiments if not is_completed(manifest, index)]
+    print(f"{len(experiments) - len(pending)} of {len(experiments)} experiments already completed")
+    with ProcessPoolExecutor(max_workers=config.n_workers) as executor:
+        tasks = {asyncio.create_task(run_experiment(index, row, study, executor, semaphore, manifest)): (index, row)
+                 for index, row in pending}
+        remaining = set(tasks)
+        while remaining:
+            finished, remaining = await asyncio.wait(remaining, return_when=asyncio.FIRST_COMPLETED)
+            for task in finished:
+                index, row = tasks[task]
+                if task.exception() is not None:
+                    print(f"Experiment {index} failed: {task.exception()}")
+                    manifest['experiments'][str(index)] = {'status': 'failed', 'error': str(task.exception())}
+                    save_manifest(manifest)
+                    failed.append(index)
+                    continue
+                append_summary(summary_row(index, row, task.result()))
+                print(f"[{len(tasks) - len(remaining)}/{len(tasks)}] Experiment {index} stored")
+    if failed:
+        print(f"Failed experiments: {sorted(failed)}, restart the script to run them again")
+    render_workbook(manifest)
+    cache_report()
+
+
+def start_campaign(study):
+    # Runs a new campaign or resumes the one in the manifest. A study is a dict of the functions describing it:
+    # build_design() -> design DataFrame, is_feasible(row), resolve_parameters(row) -> prj, mesh and initial
+    # condition values, design_values(row) -> inputs of the summary table
+    manifest = load_manifest(study['build_design'])
+    design = pd.DataFrame(**manifest['design'])
+    asyncio.run(run_campaign([(index, row) for index, row in design.iterrows() if study['is_feasible'](row)], study,
+                             manifest))
@@ -0,0 +1,58 @@
+"""
+==========================================================
+Settings
+shared by all modules of the library. The study scripts
+(Screening.py, Proxy.py) override them with configure()
+at import time, so worker processes see the same values.
+The modules read them when they are used, never when
+they are imported.
+==========================================================
+"""
+import os
+
+# Files & Directories
+directory = '/path/to/this/directory'
+ogs_exe = '/path/to/ogs/bin'
+project = 'ATES.prj'
+output_prefix = 'ATES'
+manifest_file = 'campaign.json'
+summary_file = 'summary.csv'
+summary_table = 'summary.npz'
+model_file = 'proxy_model.npz'
+
+# Operation
+water_SHC = 4100                        # specific heat capacity in j/kg/C
+water_rho = 1000                        # density of water in kg/m^3
+prod_start = 154                        # day
+prod_end = 232                          # day
+inj_start = 0                           # day
+inj_end = 153                           # day
+
+# Results
+result_columns = []     # columns of the summary table, set by the study
+factors_list = []       # regression names of the design factors, set by the study
+heavy_hitters = ['Temperature (degC)', 'Injection_Volume (m^3)', 'Temperature_gradient (degC/m)',
+                 'Aquifer_longitudinal_dispersivity (m)']   # proxy model inputs
+
+# Parallel Execution
+ogs_threads = 1                                            # OpenMP threads per OGS run
+n_workers = max(1, (os.cpu_count() or 1) // ogs_threads)   # experiments running at the same time (cores / threads)
+ogs_timeout = 24 * 3600                                    # s, wall-clock limit of a single OGS run
+sim_time = 3650                                            # days, t_end in ATES.prj (used for progress)
+
+# Monte Carlo
+mc_workers = os.cpu_count() or 1    # processes evaluating the chunks of large simulations, 1 runs them in-process
+mc_chunk_size = 2 ** 16             # samples per chunk, fixed so the results do not depend on mc_workers
+mc_bins = 4096                      # histogram bins of every input and response (quantile resolution)
+
+# Result Cache
+cache_dir = os.path.join(os.path.expanduser('~'), '.fates_cache')   # shared by Screening.py and Proxy.py
+cache_size = 2 * 1024 ** 3                                          # bytes
+
+
+def configure(**settings):
+    # Overrides the settings above, e.g. configure(directory='/data/run1', n_workers=4)
+    for name, value in settings.items():
+        if name.startswith('_') or name not in globals() or callable(globals()[name]) or name == 'os':
+            raise KeyError(f"Unknown setting '{name}'")
+        globals()[name] = value
@@ -0,0 +1,15 @@
+"""
+==========================================================
+Screening Design
+Latin hypercube designs over the ranges of the factors
+==========================================================
+"""
+import numpy as np
+from doepy import build
+
+
+def lhs_design(ranges, num_samples, seed=None):
+    # ranges is {factor: [min, max]}, a seed makes the design reproducible
+    if seed is not None:
+        np.random.seed(seed)
+    return build.lhs(d=ranges, num_samples=num_samples)
@@ -0,0 +1,100 @@
+"""
+==========================================================
+GUI
+splash screen and style shared by the screening and the
+proxy applications
+==========================================================
+"""
+import sys
+
+import matplotlib.pyplot as plt
+from PyQt5.QtCore import Qt, QPropertyAnimation, QEasingCurve
+from PyQt5.QtGui import QPixmap
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel
+
+plt.rcParams.update({'font.size': 16})
+
+style_sheet = """
+            /* Background color for the main window */
+            QWidget {
+                background-color: #001f3f;  /* Navy blue */
+                color: white;  /* White text for all widgets */
+            }
+
+            /* Style for labels */
+            QLabel {
+                color: white;  /* White text */
+                font-size: 16px;
+            }
+
+            /* Style for QLineEdit and QComboBox */
+            QLineEdit, QComboBox {
+                padding: 8px;
+                border: 1px solid #bdbdbd;
+                border-radius: 4px;
+                background-color: white;  /* White background for input fields */
+                color: #333;  /* Dark text inside input fields */
+            }
+
+            /* Button style */
+            QPushButton {
+                background-color: #B22222;  /* Firebrick red */
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+
+            /* Hover state for buttons */
+            QPushButton:hover {
+                background-color: #8B0000;  /* Dark red on hover */
+            }
+
+            /* Layout margins and padding reset */
+            QVBoxLayout, QFormLayout, QHBoxLayout {
+                margin: 0;
+                padding: 0;
+            }
+        """
+
+
+class SplashScreen(QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.initUI()
+
+    def initUI(self):
+        layout = QVBoxLayout()
+        pixmap = QPixmap('Logo1.jpeg')
+        pixmap = pixmap.scaled(900, 900, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+
+        label = QLabel()
+        label.setPixmap(pixmap)
+        label.setAlignment(Qt.AlignCenter)
+        label.setStyleSheet("background: transparent;")
+        layout.addWidget(label)
+        self.setLayout(layout)
+        self.setStyleSheet("background-color: black;")
+
+        # Set up animation
+        self.animation = QPropertyAnimation(self, b"windowOpacity")
+        self.animation.setDuration(5000)
+        self.animation.setStartValue(0)
+        self.animation.setEndValue(1)
+        self.animation.setEasingCurve(QEasingCurve.InOutQuad)
+        self.animation.finished.connect(self.go_to_page1)
+        self.animation.start()
+
+    def go_to_page1(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+
+def run_gui(main_window):
+    # Shows the main window class of an application until it is closed
+    app = QApplication(sys.argv)
+    window = main_window()
+    window.setStyleSheet(style_sheet)
+    window.show()
+    sys.exit(app.exec_())
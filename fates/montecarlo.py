@@ -0,0 +1,158 @@
+"""
+==========================================================
+Monte Carlo
+HRF and E of one or more years for sampled inputs. Samples
+are drawn in batches (the sample count doubles every
+batch) until the 95 % confidence intervals of P10, P50,
+P90 and the mean of every response are within the
+tolerance, relative to their value. Every batch is split
+into chunks of config.mc_chunk_size samples, evaluated on
+a process pool once a batch holds more than one chunk.
+A chunk is reduced to a summary of every input and
+response (see fates/statistics.py), only these are sent
+back and merged in chunk order. The histograms span the
+values of the first chunk (later values outside are only
+counted), the quantile windows its percentiles, each with
+config.mc_bins bins.
+Pseudo-random chunks draw from their own stream spawned
+from one SeedSequence, quasi-random chunks skip ahead in
+one scrambled sequence, so the results for a seed do not
+depend on the number of workers.
+The intervals of the percentiles are distribution-free
+order statistic intervals, the one of the mean uses the
+normal approximation. Both assume independent samples,
+so they are conservative for quasi-random points.
+==========================================================
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from fates import config
+from fates.proxy import evaluate_proxy, get_compiled_model
+from fates.sampling import map_inputs, sequence_points
+from fates.statistics import histogram_edges, merge_summaries, quantile_windows, summarize, summary_kde, \
+    summary_quantiles, summary_std
+
+percentiles = {'P10': 10, 'P50': 50, 'P90': 90}
+percentile_fractions = [percentile / 100 for percentile in percentiles.values()]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Confidence Intervals
+# ----------------------------------------------------------------------------------------------------------------------
+
+def summary_intervals(summary, z=1.96):
+    # {statistic: (value, low, high)} of P10, P50, P90 and the mean. The percentile intervals reach from the
+    # order statistic of rank n p - z sqrt(n p (1 - p)) to the one of rank n p + z sqrt(n p (1 - p))
+    n = summary['count']
+    fractions = []
+    for percentile in percentiles.values():
+        p = percentile / 100
+        half_width = z * np.sqrt(p * (1 - p) / n)
+        fractions += [p, max(p - half_width, 0), min(p + half_width, 1)]
+    values = summary_quantiles(summary, fractions).reshape(-1, 3)
+    intervals = {name: tuple(value) for name, value in zip(percentiles, values)}
+    mean = summary['mean']
+    half_width = z * summary_std(summary) / np.sqrt(n) if n > 1 else np.inf
+    intervals['mean'] = (mean, mean - half_width, mean + half_width)
+    return intervals
+
+
+def is_converged(intervals, tolerance):
+    # Every interval lies within value +- tolerance * |value|
+    return all(max(high - value, value - low) <= tolerance * abs(value) for value, low, high in intervals.values())
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Chunks
+# ----------------------------------------------------------------------------------------------------------------------
+
+def simulate_chunk(task):
+    # Summaries of the inputs and responses of one chunk. task holds everything a worker process needs: ranges,
+    # method, seed, start, n_samples, the compiled proxies, the histogram edges and the quantile windows of the
+    # responses. Without edges the values are returned as they are
+    points = sequence_points(len(task['ranges']), task['method'], task['seed'], task['start'], task['n_samples'])
+    values = map_inputs(task['ranges'], points)
+    X = np.column_stack(list(values.values()))
+    values.update({name: evaluate_proxy(proxy, X) for name, proxy in task['proxies'].items()})
+    if task['edges'] is None:
+        return values
+    return {name: summarize(values[name], task['edges'][name], task['windows'].get(name, ())) for name in values}
+
+
+def monte_carlo_result(summaries, responses, max_samples, converged, cancelled):
+    return {
+        'summaries': summaries,
+        'intervals': {name: summary_intervals(summaries[name]) for name in responses},
+        'kde': {name: summary_kde(summaries[name]) for name in responses},  # (values, densities) for plotting
+        'n_samples': summaries[responses[0]]['count'],
+        'max_samples': max_samples,
+        'converged': converged,
+        'cancelled': cancelled
+    }
+
+
+def run_monte_carlo(ranges, year_numbers, method='random', tolerance=0.005, max_samples=100000, batch_size=4096,
+                    seed=None, n_workers=None, progress=None, cancelled=None):
+    # ranges as for sample_inputs, year_numbers is one year or a list of them. A tolerance of 0 draws max_samples
+    # samples. Returns the summaries of every input and response (HRF<year>, E<year>) and the confidence intervals
+    # of the responses. n_workers defaults to config.mc_workers. progress(result) is called with the partial
+    # result after every chunk but the last, the run stops after the current chunk once cancelled() is true
+    year_numbers = [year_numbers] if np.isscalar(year_numbers) else list(year_numbers)
+    proxies = {f'{target}{year_number}': get_compiled_model(year_number, target)
+               for year_number in year_numbers for target in ['HRF', 'E']}
+    responses = list(proxies)
+    n_workers = config.mc_workers if n_workers is None else n_workers
+    if method == 'sobol':  # Sobol batches keep their balance when every total is a power of two, within the limit
+        max_samples = 2 ** int(np.floor(np.log2(max(max_samples, 1))))
+        batch_size = min(2 ** int(np.ceil(np.log2(batch_size))), max_samples)
+    seed_sequence = np.random.SeedSequence(seed)
+    sequence_seed = seed_sequence.spawn(1)[0]  # scrambling of the quasi-random sequence
+    summaries = edges = windows = executor = None
+    n_done = 0
+    stopped = False
+    try:
+        while True:
+            # Without a tolerance all samples form one batch
+            n_batch = max_samples - n_done if tolerance <= 0 else min(max(batch_size, n_done), max_samples - n_done)
+            tasks = [{'ranges': ranges, 'method': method,
+                      'seed': seed_sequence.spawn(1)[0] if method == 'random' else sequence_seed,
+                      'start': start, 'n_samples': min(config.mc_chunk_size, n_done + n_batch - start),
+                      'proxies': proxies, 'edges': edges, 'windows': windows}
+                     for start in range(n_done, n_done + n_batch, config.mc_chunk_size)]
+
+            # The histograms cover the values of the first chunk, the quantile windows its percentiles
+            if edges is None:
+                values = simulate_chunk(tasks[0])
+                edges = {name: histogram_edges(values[name], config.mc_bins) for name in values}
+                windows = {name: quantile_windows(values[name], percentile_fractions, config.mc_bins)
+                           for name in responses}
+                summaries = {name: summarize(values[name], edges[name], windows.get(name, ())) for name in values}
+                n_done += tasks[0]['n_samples']
+                tasks = [dict(task, edges=edges, windows=windows) for task in tasks[1:]]
+
+            if executor is None and n_workers > 1 and len(tasks) > 1:
+                # Spawned workers, the GUI runs the simulation in a thread and forking a threaded process is unsafe
+                executor = ProcessPoolExecutor(n_workers, mp_context=multiprocessing.get_context('spawn'))
+            chunks = map(simulate_chunk, tasks) if executor is None else executor.map(simulate_chunk, tasks)
+            for i, chunk in enumerate(chunks):
+                summaries = {name: merge_summaries(summaries[name], chunk[name]) for name in summaries}
+                n_done += tasks[i]['n_samples']
+                stopped = cancelled is not None and cancelled()
+                if stopped:
+                    break
+                if progress is not None and i + 1 < len(tasks):
+                    progress(monte_carlo_result(summaries, responses, max_samples, False, False))
+
+            result = monte_carlo_result(summaries, responses, max_samples, False, stopped)
+            result['converged'] = tolerance > 0 and all(is_converged(result['intervals'][name], tolerance)
+                                                        for name in responses)
+            if result['converged'] or stopped or n_done >= max_samples:
+                return result
+            if progress is not None:
+                progress(result)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,137 @@
+"""
+==========================================================
+Postprocessing
+energy production, consumption and storage of the well
+time series of an experiment, their yearly totals (E_out,
+E_in, Net_E, COP and HRF) and the typed summary table
+'summary.npz' read by the analysis and the proxy models
+==========================================================
+"""
+import os
+
+import numpy as np
+
+from fates import config
+
+
+def year_windows(times, start, end, years=10):
+    # First and last (exclusive) row of the window start < t < end of every year, the times are sorted
+    starts = start + 365 * np.arange(years)
+    ends = end + 365 * np.arange(years)
+    return np.searchsorted(times, starts, side='right'), np.searchsorted(times, ends, side='left')
+
+
+def window_rows(n_rows, first, last):
+    # Boolean mask of the rows that fall in one of the (non-overlapping) windows
+    rows = np.arange(n_rows)
+    window = np.searchsorted(first, rows, side='right') - 1
+    return (window >= 0) & (rows < last[np.maximum(window, 0)])
+
+
+def window_sums(values, first, last):
+    # Sum of the values of every window from the cumulative sum
+    cumulative = np.concatenate(([0], np.cumsum(np.nan_to_num(values))))
+    return cumulative[last] - cumulative[first]
+
+
+def energy_balance(times, T_hot, T_cold, P_hot, P_cold, inj_volume, years=10):
+    # ----------------------------------------------------
+    # Calculating Energy Production & Consumption
+    # rows outside the production and injection windows
+    # are NaN, the yearly totals are summed per window
+    # ----------------------------------------------------
+    times = np.asarray(times, dtype=float)
+    delta_T = np.asarray(T_hot, dtype=float) - np.asarray(T_cold, dtype=float)
+    delta_P = np.abs(np.asarray(P_hot, dtype=float) - np.asarray(P_cold, dtype=float))
+    delta_t = np.diff(times, prepend=np.nan)
+    prod_time = config.prod_end - config.prod_start
+    inj_time = config.inj_end - config.inj_start
+    prod_rate = (inj_volume / prod_time) / (24 * 3600)  # m^3/s
+    inj_rate = (inj_volume / inj_time) / (24 * 3600)  # m^3/s
+    prod_first, prod_last = year_windows(times, config.prod_start, config.prod_end, years)
+    inj_first, inj_last = year_windows(times, config.inj_start, config.inj_end, years)
+    production = window_rows(len(times), prod_first, prod_last)
+    injection = window_rows(len(times), inj_first, inj_last)
+
+    columns = {}
+    # Energy Production
+    columns['Energy Production (Mw)'] = np.where(
+        production, delta_T * prod_rate * config.water_rho * config.water_SHC / 1000000, np.nan)
+    columns['Energy Production (Gwh)'] = delta_t * columns['Energy Production (Mw)'] * 24 / 1000
+    # Energy Consumption During Production And Injection
+    columns['Energy Consumption (Mw)'] = np.where(production, delta_P * prod_rate / 0.5 / 1000000,
+                                                  np.where(injection, delta_P * inj_rate / 0.5 / 1000000, np.nan))
+    columns['Energy Consumption (Gwh)'] = delta_t * columns['Energy Consumption (Mw)'] * 24 / 1000
+    columns['Temperature Difference (degC)'] = np.where(production | injection, delta_T, np.nan)
+    # Energy Injection
+    columns['Energy Stored (Mw)'] = np.where(
+        injection, delta_T * inj_rate * config.water_rho * config.water_SHC / 1000000, np.nan)
+    columns['Energy Stored (Gwh)'] = delta_t * columns['Energy Stored (Mw)'] * 24 / 1000
+
+    E_out = window_sums(columns['Energy Production (Gwh)'], prod_first, prod_last)
+    E_in = (window_sums(columns['Energy Consumption (Gwh)'], prod_first, prod_last)
+            + window_sums(columns['Energy Consumption (Gwh)'], inj_first, inj_last))
+    E_stored = window_sums(columns['Energy Stored (Gwh)'], inj_first, inj_last)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        yearly = {'E_out': E_out, 'E_in': E_in, 'Net_E': E_out - E_in, 'COP': E_out / E_in, 'HRF': E_out / E_stored}
+    return columns, yearly
+
+
+def summary_row(index, row, output, yearly=None):
+    # Inputs followed by E_out, E_in, Net_E, COP and HRF of years 2 to 10
+    if yearly is None:
+        yearly = energy_balance(output['times'], output['T_hot'], output['T_cold'], output['P_hot'],
+                                output['P_cold'], row['Vinj'])[1]
+    return [index] + list(output['inputs']) + np.concatenate(
+        [yearly[name][1:] for name in ['E_out', 'E_in', 'Net_E', 'COP', 'HRF']]).tolist()
+
+
+def save_experiment(workbook, index, row, output):
+    columns, yearly = energy_balance(output['times'], output['T_hot'], output['T_cold'], output['P_hot'],
+                                     output['P_cold'], row['Vinj'])
+
+    # ----------------------------------------------------
+    # Writing The Time Series And The Yearly Results
+    # ----------------------------------------------------
+    table = {'Time(day)': output['times'],
+             'Hot Well Temperature (degC)': output['T_hot'],
+             'Cold Well Temperature (degC)': output['T_cold'],
+             'Energy Production (Mw)': columns['Energy Production (Mw)'],
+             'Energy Production (Gwh)': columns['Energy Production (Gwh)'],
+             'Hot Well Pressure (Pa)': output['P_hot'],
+             'Cold Well Pressure (Pa)': output['P_cold'],
+             'Energy Consumption (Mw)': columns['Energy Consumption (Mw)'],
+             'Energy Consumption (Gwh)': columns['Energy Consumption (Gwh)'],
+             'Temperature Difference (degC)': columns['Temperature Difference (degC)'],
+             'Energy Stored (Mw)': columns['Energy Stored (Mw)'],
+             'Energy Stored (Gwh)': columns['Energy Stored (Gwh)']}
+    out_sheet = workbook.create_sheet(title=str(index))
+    out_sheet.append(list(table))
+    for values in np.column_stack(list(table.values())).tolist():
+        out_sheet.append([None if value != value else value for value in values])  # NaN -> empty cell
+
+    summary = summary_row(index, row, output, yearly)
+    for column, value in enumerate(summary, start=1):
+        workbook.worksheets[0].cell(row=index + 2, column=column, value=value)
+    return summary
+
+
+def save_summary_table(rows):
+    # Typed columnar copy of the result sheet (float64, one column per result column), read by the analysis
+    table_path = os.path.join(config.directory, config.summary_table)
+    data = np.array(rows, dtype=float).reshape(-1, len(config.result_columns))
+    with open(table_path + '.tmp', 'wb') as file:
+        np.savez(file, columns=np.array(config.result_columns), data=data)
+    os.replace(table_path + '.tmp', table_path)
+
+
+def load_summary():
+    # Reads the summary table, result.xlsx is only parsed for campaigns that were run before it existed
+    import pandas as pd
+    table_path = os.path.join(config.directory, config.summary_table)
+    if not os.path.exists(table_path):
+        return pd.read_excel(os.path.join(config.directory, 'result.xlsx'), sheet_name=0)
+    with np.load(table_path) as table:
+        df = pd.DataFrame(table['data'], columns=table['columns'].tolist())
+    df['Experiment'] = df['Experiment'].astype(int)
+    return df
@@ -0,0 +1,370 @@
+"""
+==========================================================
+Preprocessing
+builds the gmsh geometry of a mesh once, prepares the
+folder of an experiment with its prj file, the linked
+boundary meshes and the initial temperature and pressure
+fields of main_domain.vtu
+==========================================================
+"""
+import json
+import math
+import os
+import shutil
+
+import numpy as np
+
+from fates import config
+
+
+def make_run_context(index):
+    folder_path = os.path.join(config.directory, str(index))
+    output_dir = os.path.join(folder_path, 'out' + str(index))
+    project_name, project_extension = os.path.splitext(config.project)
+    return {
+        'folder': folder_path,
+        'project_file': os.path.join(folder_path, project_name + str(index) + project_extension),
+        'output_dir': output_dir,
+        'log_file': os.path.join(output_dir, 'out.log'),
+        'pvd_file': os.path.join(output_dir, config.output_prefix + '.pvd')
+    }
+
+
+def build_mesh(mesh, mesh_dir):
+    # ----------------------------------------------------
+    # Creating Geometry Once Per Unique Mesh Using Gmsh
+    # the mesh is built in a temporary folder and renamed
+    # when complete, so an interrupted build is never reused
+    # ----------------------------------------------------
+    if os.path.exists(os.path.join(mesh_dir, "main_domain.vtu")):
+        return mesh_dir
+    import gmsh
+    import ogstools.msh2vtu
+    build_path = mesh_dir + '.tmp' + str(os.getpid())
+    if os.path.exists(build_path):
+        shutil.rmtree(build_path)
+    os.makedirs(build_path)
+    dip = mesh['dip']
+    h = mesh['h']
+    aquifer_depth = mesh['aquifer_depth']
+    cap_thickness = mesh['cap_thickness']
+    n_z = mesh['n_z']
+    lc = mesh['lc']
+    dip_rad = math.radians(dip)
+    c = math.cos(dip_rad)  # deviation in x direction
+    s = math.sin(dip_rad)  # deviation in y direction
+    gmsh.initialize()
+
+    # Hot well
+    gmsh.model.geo.addPoint(-250 * c, 0, (-1 * aquifer_depth) - 250 * s, 0.2, 0)
+    gmsh.model.geo.addPoint(-249.5 * c, 0.5, (-1 * aquifer_depth) - 249.5 * s, 0.5, 101)
+    gmsh.model.geo.addPoint(-249.5 * c, -0.5, (-1 * aquifer_depth) - 249.5 * s, 0.5, 102)
+    gmsh.model.geo.addPoint(-250.5 * c, -0.5, (-1 * aquifer_depth) - 250.5 * s, 0.5, 103)
+    gmsh.model.geo.addPoint(-250.5 * c, 0.5, (-1 * aquifer_depth) - 250.5 * s, 0.5, 104)
+
+    gmsh.model.geo.addCircleArc(101, 0, 102, 101)
+    gmsh.model.geo.addCircleArc(102, 0, 103, 102)
+    gmsh.model.geo.addCircleArc(103, 0, 104, 103)
+    gmsh.model.geo.addCircleArc(104, 0, 101, 104)
+
+    gmsh.model.geo.addLine(0, 101, 105)
+    gmsh.model.geo.addLine(0, 102, 106)
+    gmsh.model.geo.addLine(0, 103, 107)
+    gmsh.model.geo.addLine(0, 104, 108)
+
+    gmsh.model.geo.addCurveLoop([105, 101, -106], 101)
+    gmsh.model.geo.addCurveLoop([106, 102, -107], 102)
+    gmsh.model.geo.addCurveLoop([107, 103, -108], 103)
+    gmsh.model.geo.addCurveLoop([108, 104, -105], 104)
+
+    gmsh.model.geo.addPlaneSurface([101], 101)
+    gmsh.model.geo.addPlaneSurface([102], 102)
+    gmsh.model.geo.addPlaneSurface([103], 103)
+    gmsh.model.geo.addPlaneSurface([104], 104)
+
+    # Cold well
+    gmsh.model.geo.addPoint(250 * c, 0, (-1 * aquifer_depth) + 250 * s, 0.2, 200)
+    gmsh.model.geo.addPoint(249.5 * c, 0.5, (-1 * aquifer_depth) + 249.5 * s, 0.5, 201)
+    gmsh.model.geo.addPoint(249.5 * c, -0.5, (-1 * aquifer_depth) + 249.5 * s, 0.5, 202)
+    gmsh.model.geo.addPoint(250.5 * c, -0.5, (-1 * aquifer_depth) + 250.5 * s, 0.5, 203)
+    gmsh.model.geo.addPoint(250.5 * c, 0.5, (-1 * aquifer_depth) + 250.5 * s, 0.5, 204)
+
+    gmsh.model.geo.addCircleArc(201, 200, 202, 201)
+    gmsh.model.geo.addCircleArc(202, 200, 203, 202)
+    gmsh.model.geo.addCircleArc(203, 200, 204, 203)
+    gmsh.model.geo.addCircleArc(204, 200, 201, 204)
+
+    gmsh.model.geo.addLine(200, 201, 205)
+    gmsh.model.geo.addLine(200, 202, 206)
+    gmsh.model.geo.addLine(200, 203, 207)
+    gmsh.model.geo.addLine(200, 204, 208)
+
+    gmsh.model.geo.addCurveLoop([206, -201, -205], 201)
+    gmsh.model.geo.addCurveLoop([207, -202, -206], 202)
+    gmsh.model.geo.addCurveLoop([208, -203, -207], 203)
+    gmsh.model.geo.addCurveLoop([205, -204, -208], 204)
+
+    gmsh.model.geo.addPlaneSurface([201], 201)
+    gmsh.model.geo.addPlaneSurface([202], 202)
+    gmsh.model.geo.addPlaneSurface([203], 203)
+    gmsh.model.geo.addPlaneSurface([204], 204)
+
+    # Aquifer around hot well
+    gmsh.model.geo.addPoint(0, 250, (-1 * aquifer_depth), lc, 1)
+    gmsh.model.geo.addPoint(0, -250, (-1 * aquifer_depth), lc, 2)
+    gmsh.model.geo.addPoint(-500 * c, -250, (-1 * aquifer_depth) - 500 * s, lc, 3)
+    gmsh.model.geo.addPoint(-500 * c, 250, (-1 * aquifer_depth) - 500 * s, lc, 4)
+
+    gmsh.model.geo.addLine(1, 2, 1)
+    gmsh.model.geo.addLine(2, 3, 2)
+    gmsh.model.geo.addLine(3, 4, 3)
+    gmsh.model.geo.addLine(4, 1, 4)
+    gmsh.model.geo.addLine(101, 1, 5)
+    gmsh.model.geo.addLine(102, 2, 6)
+    gmsh.model.geo.addLine(103, 3, 7)
+    gmsh.model.geo.addLine(104, 4, 8)
+
+    gmsh.model.geo.addCurveLoop([5, 1, -6, -101], 1)
+    gmsh.model.geo.addCurveLoop([6, 2, -7, -102], 2)
+    gmsh.model.geo.addCurveLoop([7, 3, -8, -103], 3)
+    gmsh.model.geo.addCurveLoop([8, 4, -5, -104], 4)
+
+    gmsh.model.geo.addPlaneSurface([1], 1)
+    gmsh.model.geo.addPlaneSurface([2], 2)
+    gmsh.model.geo.addPlaneSurface([3], 3)
+    gmsh.model.geo.addPlaneSurface([4], 4)
+
+    # Aquifer around cold well
+    gmsh.model.geo.addPoint(500 * c, -250, (-1 * aquifer_depth) + 500 * s, lc, 5)
+    gmsh.model.geo.addPoint(500 * c, 250, (-1 * aquifer_depth) + 500 * s, lc, 6)
+
+    gmsh.model.geo.addLine(2, 5, 9)
+    gmsh.model.geo.addLine(5, 6, 10)
+    gmsh.model.geo.addLine(6, 1, 11)
+    gmsh.model.geo.addLine(201, 1, 12)
+    gmsh.model.geo.addLine(202, 2, 13)
+    gmsh.model.geo.addLine(203, 5, 14)
+    gmsh.model.geo.addLine(204, 6, 15)
+
+    gmsh.model.geo.addCurveLoop([201, 13, -1, -12], 5)
+    gmsh.model.geo.addCurveLoop([202, 14, -9, -13], 6)
+    gmsh.model.geo.addCurveLoop([203, 15, -10, -14], 7)
+    gmsh.model.geo.addCurveLoop([204, 12, -11, -15], 8)
+
+    gmsh.model.geo.addPlaneSurface([5], 5)
+    gmsh.model.geo.addPlaneSurface([6], 6)
+    gmsh.model.geo.addPlaneSurface([7], 7)
+    gmsh.model.geo.addPlaneSurface([8], 8)
+
+    # Creating 3D body with extruding all surfaces
+    gmsh.model.geo.extrude([(2, 101)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 102)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 103)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 104)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 201)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 202)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 203)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 204)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 1)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 2)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 3)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 4)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 5)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 6)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 7)], 0, 0, -1 * h, [n_z], [], True)
+    gmsh.model.geo.extrude([(2, 8)], 0, 0, -1 * h, [n_z], [], True)
+
+    # Creating 3D body_Upper section non-discretized (1-cell model)
+    gmsh.model.geo.extrude([(2, 1)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 2)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 3)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 4)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 5)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 6)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 7)], 0, 0, cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 8)], 0, 0, cap_thickness, [1], [], True)
+
+    # Creating 3D body_Lower section non-discretized (1-cell model)
+    gmsh.model.geo.extrude([(2, 388)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 366)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 432)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 410)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 454)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 520)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 476)], 0, 0, -1 * cap_thickness, [1], [], True)
+    gmsh.model.geo.extrude([(2, 498)], 0, 0, -1 * cap_thickness, [1], [], True)
+
+    # Creating Main Domains
+    aquifer = gmsh.model.addPhysicalGroup(3, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16])
+    gmsh.model.setPhysicalName(3, aquifer, "aquifer")
+
+    upper_layer = gmsh.model.addPhysicalGroup(3, [17, 18, 19, 20, 21, 22, 23, 24])
+    gmsh.model.setPhysicalName(3, upper_layer, "upper_layer")
+
+    lower_layer = gmsh.model.addPhysicalGroup(3, [25, 26, 27, 28, 29, 30, 31, 32])
+    gmsh.model.setPhysicalName(3, lower_layer, "lower_layer")
+
+    # Creating Boundary lines and surfacses
+    left = gmsh.model.addPhysicalGroup(2, [401])
+    gmsh.model.setPhysicalName(2, left, "left")
+
+    right = gmsh.model.addPhysicalGroup(2, [493])
+    gmsh.model.setPhysicalName(2, right, "right")
+
+    top_aquifer = gmsh.model.geo.addPhysicalGroup(0, [1, 2])
+    gmsh.model.setPhysicalName(0, top_aquifer, "top_aquifer")
+
+    bottom_aquifer = gmsh.model.geo.addPhysicalGroup(0, [238, 242])
+    gmsh.model.setPhysicalName(0, bottom_aquifer, "bottom_aquifer")
+
+    top = gmsh.model.geo.addPhysicalGroup(2, [586, 564, 542, 608, 630, 652, 696, 674])
+    gmsh.model.setPhysicalName(2, top, "top")
+
+    bottom = gmsh.model.geo.addPhysicalGroup(2, [718, 784, 762, 740, 806, 850, 828, 872])
+    gmsh.model.setPhysicalName(2, bottom, "bottom")
+
+    # Creating source/sink lines
+    hot_source = gmsh.model.addPhysicalGroup(1, [214])
+    gmsh.model.setPhysicalName(1, hot_source, "hot_source")
+
+    cold_source = gmsh.model.addPhysicalGroup(1, [282])
+    gmsh.model.setPhysicalName(1, cold_source, "cold_source")
+
+    gmsh.model.geo.synchronize()
+    gmsh.model.mesh.setTransfiniteCurve(5, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(6, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(7, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(8, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(12, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(13, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(14, 20, "Progression", 1.21)
+    gmsh.model.mesh.setTransfiniteCurve(15, 20, "Progression", 1.21)
+    gmsh.model.mesh.setRecombine(1, 5)
+    gmsh.model.mesh.setRecombine(1, 6)
+    gmsh.model.mesh.setRecombine(1, 7)
+    gmsh.model.mesh.setRecombine(1, 8)
+    gmsh.model.mesh.setRecombine(1, 12)
+    gmsh.model.mesh.setRecombine(1, 13)
+    gmsh.model.mesh.setRecombine(1, 14)
+    gmsh.model.mesh.setRecombine(1, 15)
+
+    gmsh.model.mesh.generate(3)
+    gmsh.write(os.path.join(build_path, "main.msh"))
+
+    # Converting .msh file to .vtu files for OGS
+    ogstools.msh2vtu.msh2vtu(input_filename=os.path.join(build_path, "main.msh"),
+                             output_path=build_path,
+                             output_prefix="",
+                             dim=0,
+                             delz=False,
+                             swapxy=False,
+                             rdcd=True,
+                             ogs=True,
+                             ascii=False,
+                             log_level="DEBUG", )
+    gmsh.finalize()
+    with open(os.path.join(build_path, 'mesh.json'), 'w') as file:
+        json.dump(mesh, file, indent=2)
+    if os.path.exists(mesh_dir):
+        shutil.rmtree(build_path)
+    else:
+        os.rename(build_path, mesh_dir)
+    print(f"Mesh {os.path.basename(mesh_dir)} created in {os.path.dirname(mesh_dir)}")
+    return mesh_dir
+
+
+def link_mesh(mesh_dir, folder_path):
+    # main_domain.vtu is not linked because the initial conditions are written into it
+    for name in os.listdir(mesh_dir):
+        if not name.endswith('.vtu') or name == "main_domain.vtu":
+            continue
+        target = os.path.join(folder_path, name)
+        if os.path.exists(target):
+            os.remove(target)
+        try:
+            os.link(os.path.join(mesh_dir, name), target)
+        except OSError:  # e.g. different file systems, falls back to a copy
+            shutil.copy(os.path.join(mesh_dir, name), target)
+
+
+def initial_profile(z, top_value, bottom_value, layers=None, unit=1):
+    # Depth/value points of an initial field. Without layers the value changes linearly between the top and the
+    # bottom node of the mesh, otherwise the layers [(thickness in m, gradient per km), ...] are stacked downwards
+    # from the top node and the last gradient is extended below them. 'unit' scales the gradients (bar -> Pa)
+    top_depth = -np.max(z)
+    if layers is None:
+        return np.array([top_depth, -np.min(z)]), np.array([top_value, bottom_value])
+    thicknesses, gradients = np.asarray(layers, dtype=float).T
+    depths = top_depth + np.concatenate(([0], np.cumsum(thicknesses)))
+    values = top_value + unit * np.concatenate(([0], np.cumsum(thicknesses * gradients / 1000)))
+    if depths[-1] < -np.min(z):
+        values = np.append(values, values[-1] + unit * gradients[-1] * (-np.min(z) - depths[-1]) / 1000)
+        depths = np.append(depths, -np.min(z))
+    return depths, values
+
+
+def initial_field(z, depths, values):
+    # Interpolates a depth profile on all node elevations at once
+    return np.interp(-z, depths, values)
+
+
+def prepare_experiment(index, row, parameters, context, mesh_dir):
+    # ----------------------------------------------------
+    # Reading Data From Design
+    # parameters are the resolved values of the row
+    # ----------------------------------------------------
+    print(f"Row {index}: " + ", ".join(f"{name} = {value}" for name, value in row.items()))
+    import ogs6py.ogs
+    import pyvista as pv
+
+    # ----------------------------------------------------
+    # Creating New Folders And Copy .prj File In Each
+    # ----------------------------------------------------
+    folder_path = context['folder']
+    if not os.path.exists(folder_path):
+        os.makedirs(folder_path)
+        print(f"Folder '{str(index)}' created in {config.directory}")
+    else:
+        print(f"Folder '{str(index)}' already exists in {config.directory}")
+    shutil.copy(os.path.join(config.directory, config.project), context['project_file'])
+    if not os.path.exists(context['output_dir']):
+        os.makedirs(context['output_dir'])
+
+    # ----------------------------------------------------
+    # Replacing New Parameters In New .prj Files
+    # ----------------------------------------------------
+    new_data = ogs6py.ogs.OGS(INPUT_FILE=os.path.join(config.directory, config.project),
+                              PROJECT_FILE=context['project_file'])
+    new_data.replace_text(config.output_prefix, xpath="./time_loop/output/prefix")
+    for name, value in parameters['medium'].items():
+        new_data.replace_medium_property_value(mediumid=0, name=name, value=value)
+    for name, value in parameters.get('solid', {}).items():
+        new_data.replace_phase_property_value(mediumid=0, phase="Solid", name=name, value=value)
+    for name, value in parameters['parameters'].items():
+        new_data.replace_parameter_value(name=name, value=value)
+    new_data.write_input()
+
+    # ----------------------------------------------------
+    # Linking The Cached Geometry In Each Folder
+    # ----------------------------------------------------
+    link_mesh(mesh_dir, folder_path)
+
+    # ----------------------------------------------------
+    # Adding Pressure And Temperature Gradient to Geometry
+    # ----------------------------------------------------
+    geometry = pv.read(os.path.join(mesh_dir, "main_domain.vtu"))
+    z_coordinates = geometry.points[:, 2]
+    conditions = parameters['initial_conditions']
+    T_surface = conditions['T_surface']
+    aquifer_depth = parameters['mesh']['aquifer_depth']
+    cap_thickness = parameters['mesh']['cap_thickness']
+    h = parameters['mesh']['h']
+    T_top = T_surface + (conditions['T_gradient'] * (aquifer_depth - cap_thickness) / 1000)
+    T_bottom = T_surface + (conditions['T_gradient'] * (aquifer_depth + h + cap_thickness) / 1000)
+    p_top = conditions['p_gradient'] * 100000 * (aquifer_depth - cap_thickness) / 1000
+    p_bottom = conditions['p_gradient'] * 100000 * (aquifer_depth + h + cap_thickness) / 1000
+    geometry.point_data["T_ref"] = initial_field(
+        z_coordinates, *initial_profile(z_coordinates, T_top, T_bottom, conditions['T_layers'])).reshape(-1, 1)
+    geometry.point_data["p_ref"] = initial_field(
+        z_coordinates, *initial_profile(z_coordinates, p_top, p_bottom, conditions['p_layers'], 100000)).reshape(-1, 1)
+    geometry.save(folder_path + '/' + "main_domain.vtu")
@@ -0,0 +1,445 @@
+"""
+==========================================================
+Proxy Models
+polynomial regression of HRF and E of every operational
+year on the heavy hitters. The fitted models are saved to
+'proxy_model.npz' and compiled into raw-unit polynomial
+coefficients for fast batch prediction. Predicting with
+saved models only needs numpy, scikit-learn is imported
+when models are trained or their fitted objects are used
+==========================================================
+"""
+import hashlib
+import itertools
+import json
+import math
+import os
+import re
+
+import numpy as np
+
+from fates import config
+from fates.postprocessing import load_summary
+
+
+# Inverse normalized data
+def inverse_normalize(scaler, data):
+    return scaler.inverse_transform(data)
+
+
+# Normalizing input dataset
+def normalizing_outdataset(X_train_newdata, y_train_newdata):
+    from sklearn.preprocessing import MinMaxScaler
+    scaler_X = MinMaxScaler()
+    scaler_Y = MinMaxScaler()
+
+    X_normalized = scaler_X.fit_transform(X_train_newdata)
+    y_normalized = scaler_Y.fit_transform(y_train_newdata.values.reshape(-1, 1))
+    return X_normalized, y_normalized, scaler_X, scaler_Y
+
+
+# Campaign results the models are trained on, read on first use
+training_data = {}
+
+
+def has_training_data():
+    return (os.path.exists(os.path.join(config.directory, config.summary_table))
+            or os.path.exists(os.path.join(config.directory, 'result.xlsx')))
+
+
+def training_frame():
+    if 'df' not in training_data:
+        training_data['df'] = load_summary()
+    return training_data['df']
+
+
+def training_values(columns):
+    # float64 values of summary columns, read from summary.npz without pandas when it exists
+    table_path = os.path.join(config.directory, config.summary_table)
+    if os.path.exists(table_path):
+        with np.load(table_path) as table:
+            names = table['columns'].tolist()
+            return table['data'][:, [names.index(name) for name in columns]]
+    return training_frame()[columns].to_numpy(dtype=float)
+
+
+# Function to train a model based on the year_number
+def train_model(year_number):
+    from sklearn.linear_model import LinearRegression
+    from sklearn.metrics import mean_squared_error, r2_score
+    from sklearn.preprocessing import PolynomialFeatures
+    df = training_frame()
+    X = df[config.heavy_hitters]
+    # Select the correct HRF and E column based on year_number
+    if year_number == 2:
+        y_HRF = df['HRF2']
+        y_E = df['E_out2 (Gwh)']
+    elif year_number == 3:
+        y_HRF = df['HRF3']
+        y_E = df['E_out3 (Gwh)']
+    elif year_number == 4:
+        y_HRF = df['HRF4']
+        y_E = df['E_out4 (Gwh)']
+    elif year_number == 5:
+        y_HRF = df['HRF5']
+        y_E = df['E_out5 (Gwh)']
+    elif year_number == 6:
+        y_HRF = df['HRF6']
+        y_E = df['E_out6 (Gwh)']
+    elif year_number == 7:
+        y_HRF = df['HRF7']
+        y_E = df['E_out7 (Gwh)']
+    elif year_number == 8:
+        y_HRF = df['HRF8']
+        y_E = df['E_out8 (Gwh)']
+    elif year_number == 9:
+        y_HRF = df['HRF9']
+        y_E = df['E_out9 (Gwh)']
+    elif year_number == 10:
+        y_HRF = df['HRF10']
+        y_E = df['E_out10 (Gwh)']
+    else:
+        raise ValueError("Invalid year_number. Please choose 2, 3, or 4.")
+
+    # Normalize the dataset
+    X_normalized_HRF, y_normalized_HRF, scaler_X_HRF, scaler_Y_HRF = normalizing_outdataset(X, y_HRF)
+    X_normalized_E, y_normalized_E, scaler_X_E, scaler_Y_E = normalizing_outdataset(X, y_E)
+
+    # Split the dataset into training and testing sets
+    train_size = int(0.7 * len(X))
+    X_train_HRF, X_test_HRF = X_normalized_HRF[:train_size], X_normalized_HRF[train_size:]
+    y_train_HRF, y_test_HRF = y_normalized_HRF[:train_size], y_normalized_HRF[train_size:]
+
+    X_train_E, X_test_E = X_normalized_E[:train_size], X_normalized_E[train_size:]
+    y_train_E, y_test_E = y_normalized_E[:train_size], y_normalized_E[train_size:]
+
+    # Create Polynomial Features
+    degree = 2
+    poly = PolynomialFeatures(degree=degree, include_bias=False)
+
+    X_train_poly_HRF = poly.fit_transform(X_train_HRF)
+    X_test_poly_HRF = poly.transform(X_test_HRF)
+
+    X_train_poly_E = poly.fit_transform(X_train_E)
+    X_test_poly_E = poly.transform(X_test_E)
+
+    lin_reg_model_HRF = LinearRegression()
+    lin_reg_model_HRF.fit(X_train_poly_HRF, y_train_HRF)
+
+    lin_reg_model_E = LinearRegression()
+    lin_reg_model_E.fit(X_train_poly_E, y_train_E)
+
+    y_pred_normalized_HRF = lin_reg_model_HRF.predict(X_test_poly_HRF)
+    y_pred_normalized_E = lin_reg_model_E.predict(X_test_poly_E)
+
+    y_pred_HRF = inverse_normalize(scaler_Y_HRF, y_pred_normalized_HRF.reshape(-1, 1))
+    y_test_HRF_orig = inverse_normalize(scaler_Y_HRF, y_test_HRF)
+
+    y_pred_E = inverse_normalize(scaler_Y_E, y_pred_normalized_E.reshape(-1, 1))
+    y_test_E_orig = inverse_normalize(scaler_Y_E, y_test_E)
+
+    # Evaluate the models
+    r2_HRF = r2_score(y_test_HRF_orig, y_pred_HRF)
+    rmse_test_HRF = math.sqrt(mean_squared_error(y_test_HRF_orig, y_pred_HRF))
+
+    r2_E = r2_score(y_test_E_orig, y_pred_E)
+    rmse_test_E = math.sqrt(mean_squared_error(y_test_E_orig, y_pred_E))
+
+    intercept_HRF = lin_reg_model_HRF.intercept_[0]
+    coefficients_HRF = lin_reg_model_HRF.coef_[0]
+    feature_names = poly.get_feature_names_out(['A', 'B', 'C', 'D'])
+
+    equation_terms_HRF = [f'{intercept_HRF:.3f}']
+    for feature_name, coef in zip(feature_names, coefficients_HRF):
+        equation_terms_HRF.append(f'({coef:.3f} * {feature_name})')
+    regression_equation_HRF = f'HRF{year_number} = ' + ' + '.join(equation_terms_HRF)
+
+    intercept_E = lin_reg_model_E.intercept_[0]
+    coefficients_E = lin_reg_model_E.coef_[0]
+
+    equation_terms_E = [f'{intercept_E:.3f}']
+    for feature_name, coef in zip(feature_names, coefficients_E):
+        equation_terms_E.append(f'({coef:.3f} * {feature_name})')
+    regression_equation_E = f'E{year_number} = ' + ' + '.join(equation_terms_E)
+
+    print(f"Model for HRF{year_number}: {regression_equation_HRF}")
+    print(f"R^2 (HRF{year_number}): {r2_HRF}, RMSE: {rmse_test_HRF}")
+
+    print(f"Model for E{year_number}: {regression_equation_E}")
+    print(f"R^2 (E{year_number}): {r2_E}, RMSE: {rmse_test_E}")
+
+    return {
+        "HRF": {
+            "model": lin_reg_model_HRF,
+            "equation": regression_equation_HRF,
+            "degree": degree,
+            "r2": r2_HRF,
+            "rmse": rmse_test_HRF
+        },
+        "E": {
+            "model": lin_reg_model_E,
+            "equation": regression_equation_E,
+            "degree": degree,
+            "r2": r2_E,
+            "rmse": rmse_test_E
+        },
+        "poly_features": poly,
+        "scalers": {
+            "X": scaler_X_HRF,  # Assuming same scaler for both
+            "Y_HRF": scaler_Y_HRF,
+            "Y_E": scaler_Y_E
+        }
+    }
+
+
+# Fitted models of every year, each year is trained once on first use (or restored from the saved models) and
+# reused by all predictions
+models = {}
+
+
+def get_model(year_number):
+    # The saved models hold the same years as train_model, other years are an invalid input either way
+    if year_number not in range(2, 11):
+        raise ValueError("Invalid year_number. Please choose a year from 2 to 10.")
+    if year_number not in models:
+        models[year_number] = restore_model(year_number) if saved_models else train_model(year_number)
+    return models[year_number]
+
+
+# Compiled proxies, (year_number, target) -> raw-unit coefficients of HRF or E = c + b.x + x.A.x
+compiled_models = {}
+
+
+def compile_model(year_number, target):
+    # Collapses the fitted input scaler, degree-2 polynomial features, linear model and output scaler of one year
+    # and target ('HRF' or 'E') into a constant c, a linear vector b and a symmetric quadratic matrix A
+    model_data = get_model(year_number)
+    scaler_X = model_data["scalers"]["X"]
+    scaler_Y = model_data["scalers"]["Y_" + target]
+    lin_reg_model = model_data[target]["model"]
+    powers = model_data["poly_features"].powers_
+    if powers.sum(axis=1).max() > 2:
+        raise ValueError("Only polynomials up to degree 2 can be compiled.")
+
+    # Coefficients on the normalized inputs z
+    n_inputs = powers.shape[1]
+    b_z = np.zeros(n_inputs)
+    A_z = np.zeros((n_inputs, n_inputs))
+    for power, coefficient in zip(powers, lin_reg_model.coef_.ravel()):
+        i = np.flatnonzero(power)
+        if power.sum() == 1:
+            b_z[i[0]] += coefficient
+        elif len(i) == 1:
+            A_z[i[0], i[0]] += coefficient
+        else:
+            A_z[i[0], i[1]] += coefficient / 2
+            A_z[i[1], i[0]] += coefficient / 2
+
+    # Substituting z = scale * x + min and undoing the output scaling
+    scale, shift = scaler_X.scale_, scaler_X.min_
+    c = lin_reg_model.intercept_[0] + b_z @ shift + shift @ A_z @ shift
+    b = scale * (b_z + 2 * A_z @ shift)
+    A = scale[:, None] * A_z * scale[None, :]
+    return {
+        'c': (c - scaler_Y.min_[0]) / scaler_Y.scale_[0],
+        'b': b / scaler_Y.scale_[0],
+        'A': A / scaler_Y.scale_[0]
+    }
+
+
+def get_compiled_model(year_number, target):
+    if (year_number, target) not in compiled_models:
+        compiled_models[(year_number, target)] = compile_model(year_number, target)
+    return compiled_models[(year_number, target)]
+
+
+def evaluate_proxy(proxy, X):
+    # Evaluates a compiled proxy for an (n, 4) array of raw inputs
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    return proxy['c'] + X @ proxy['b'] + np.einsum('ni,ij,nj->n', X, proxy['A'], X, optimize=True)
+
+
+# Joint proxy of all years and both targets, outputs HRF2..HRF10 followed by E2..E10
+proxy_outputs = [f'{target}{year_number}' for target in ['HRF', 'E'] for year_number in range(2, 11)]
+joint_proxy = {}
+
+
+def polynomial_terms(X):
+    # [1, x_i, x_i * x_j for i <= j] of an (n, 4) array of raw inputs, shared by all outputs
+    X = np.atleast_2d(np.asarray(X, dtype=float))
+    i, j = np.triu_indices(X.shape[1])
+    return np.hstack([np.ones((len(X), 1)), X, X[:, i] * X[:, j]])
+
+
+def compile_joint_proxy():
+    # Stacks the compiled proxies into one weight matrix, row k multiplies column k of polynomial_terms
+    columns = []
+    for output in proxy_outputs:
+        target, year_number = re.fullmatch(r'(HRF|E)(\d+)', output).groups()
+        proxy = get_compiled_model(int(year_number), target)
+        i, j = np.triu_indices(len(proxy['b']))
+        quadratic = np.where(i == j, 1, 2) * proxy['A'][i, j]
+        columns.append(np.concatenate(([proxy['c']], proxy['b'], quadratic)))
+    return np.column_stack(columns)
+
+
+def predict_all(X):
+    # Predicts all 18 outputs (columns ordered as proxy_outputs) for an (n, 4) array in one matrix product
+    if 'weights' not in joint_proxy:
+        joint_proxy['weights'] = compile_joint_proxy()
+    return polynomial_terms(X) @ joint_proxy['weights']
+
+
+def training_data_hash():
+    # Hash of the heavy hitters and responses the proxy models are trained on
+    columns = config.heavy_hitters + [f'HRF{year_number}' for year_number in range(2, 11)] \
+        + [f'E_out{year_number} (Gwh)' for year_number in range(2, 11)]
+    content = json.dumps(columns).encode() + np.ascontiguousarray(training_values(columns)).tobytes()
+    return hashlib.sha256(content).hexdigest()
+
+
+def save_models():
+    # Trains every year and saves the fitted proxy models with the hash of their training data
+    arrays = {'heavy_hitters': np.array(config.heavy_hitters), 'data_hash': np.array(training_data_hash())}
+    for year_number in range(2, 11):
+        model_data = get_model(year_number)
+        # All years share the input scaling and the polynomial features
+        arrays['X_range'] = np.vstack([model_data["scalers"]["X"].data_min_, model_data["scalers"]["X"].data_max_])
+        arrays['powers'] = model_data["poly_features"].powers_
+        arrays['degree'] = np.array(model_data["HRF"]["degree"])
+        for target in ['HRF', 'E']:
+            prefix = f'{target}{year_number}_'
+            scaler_Y = model_data["scalers"]["Y_" + target]
+            arrays[prefix + 'Y_range'] = np.concatenate([scaler_Y.data_min_, scaler_Y.data_max_])
+            arrays[prefix + 'coef'] = model_data[target]["model"].coef_
+            arrays[prefix + 'intercept'] = model_data[target]["model"].intercept_
+            arrays[prefix + 'equation'] = np.array(model_data[target]["equation"])
+            arrays[prefix + 'r2'] = np.array(model_data[target]["r2"])
+            arrays[prefix + 'rmse'] = np.array(model_data[target]["rmse"])
+            # Compiled coefficients, predictions with the loaded models do not need scikit-learn
+            for name, value in get_compiled_model(year_number, target).items():
+                arrays[prefix + name] = value
+    model_path = os.path.join(config.directory, config.model_file)
+    with open(model_path + '.tmp', 'wb') as file:
+        np.savez(file, **arrays)
+    os.replace(model_path + '.tmp', model_path)
+    print(f"Proxy models saved to {model_path}")
+
+
+def polynomial_powers(n_inputs, degree):
+    # Exponents of the polynomial features without bias, in the order of scikit-learn's PolynomialFeatures
+    powers = []
+    for order in range(1, degree + 1):
+        for inputs in itertools.combinations_with_replacement(range(n_inputs), order):
+            powers.append(np.bincount(inputs, minlength=n_inputs))
+    return np.array(powers)
+
+
+# Arrays of the loaded proxy_model.npz, the fitted objects of a year are only rebuilt by get_model
+saved_models = {}
+
+
+def load_models(data_hash=None):
+    # Loads the saved proxy models. Returns False when there are none or when they were trained on other results
+    # (data_hash is None skips this check, e.g. for models shipped without the campaign results)
+    model_path = os.path.join(config.directory, config.model_file)
+    if not os.path.exists(model_path):
+        return False
+    with np.load(model_path) as artifact:
+        if (artifact['heavy_hitters'].tolist() != config.heavy_hitters
+                or (data_hash is not None and str(artifact['data_hash']) != data_hash)):
+            print(f"{model_path} is out of date, the proxy models are trained again")
+            return False
+        if not np.array_equal(polynomial_powers(len(config.heavy_hitters), int(artifact['degree'])),
+                              artifact['powers']):
+            return False
+        arrays = {name: artifact[name] for name in artifact.files}
+    models.clear()
+    compiled_models.clear()
+    joint_proxy.clear()
+    saved_models.clear()
+    saved_models.update(arrays)
+    for year_number in range(2, 11):
+        for target in ['HRF', 'E']:
+            prefix = f'{target}{year_number}_'
+            if prefix + 'c' in arrays:
+                compiled_models[(year_number, target)] = {name: arrays[prefix + name][()] for name in 'cbA'}
+    print(f"Proxy models loaded from {model_path}")
+    return True
+
+
+def restore_model(year_number):
+    # Rebuilds the fitted scalers, polynomial features and linear models of one year from the saved arrays
+    import pandas as pd
+    from sklearn.linear_model import LinearRegression
+    from sklearn.preprocessing import MinMaxScaler, PolynomialFeatures
+    degree = int(saved_models['degree'])
+    poly = PolynomialFeatures(degree=degree, include_bias=False).fit(np.zeros((1, len(config.heavy_hitters))))
+    scaler_X = MinMaxScaler().fit(pd.DataFrame(saved_models['X_range'], columns=config.heavy_hitters))
+    model_data = {"poly_features": poly, "scalers": {"X": scaler_X}}
+    for target in ['HRF', 'E']:
+        prefix = f'{target}{year_number}_'
+        lin_reg_model = LinearRegression()
+        lin_reg_model.coef_ = saved_models[prefix + 'coef']
+        lin_reg_model.intercept_ = saved_models[prefix + 'intercept']
+        lin_reg_model.n_features_in_ = poly.n_output_features_
+        model_data["scalers"]["Y_" + target] = MinMaxScaler().fit(saved_models[prefix + 'Y_range'].reshape(-1, 1))
+        model_data[target] = {
+            "model": lin_reg_model,
+            "equation": str(saved_models[prefix + 'equation']),
+            "degree": degree,
+            "r2": float(saved_models[prefix + 'r2']),
+            "rmse": float(saved_models[prefix + 'rmse'])
+        }
+    return model_data
+
+
+# Function to predict HRF or E of one year for many inputs at once
+def predict_batch(X, year_number, target):
+    # X is an (n, 4) array of injection temperature, injection volume, temperature gradient and dispersivity,
+    # target is 'HRF' or 'E'. All rows are predicted in one pass of the compiled proxy
+    return evaluate_proxy(get_compiled_model(year_number, target), X)
+
+
+# Function to predict HRF
+def predict_HRF(injection_temp, injection_vol, temp_gradient, dispersivity, year_number):
+    try:
+        model_data = get_model(year_number)
+        pred_HRF = predict_batch([[injection_temp, injection_vol, temp_gradient, dispersivity]], year_number, "HRF")
+        return (
+            pred_HRF[0],
+            model_data["HRF"]["equation"],
+            model_data["HRF"]["degree"],
+            model_data["HRF"]["r2"],
+            model_data["HRF"]["rmse"]
+        )
+    except ValueError:
+        return None, None, None, None, None  # Return None for all outputs in case of error
+
+
+def predict_E(injection_temp, injection_vol, temp_gradient, dispersivity, year_number):
+    try:
+        model_data = get_model(year_number)
+        pred_E = predict_batch([[injection_temp, injection_vol, temp_gradient, dispersivity]], year_number, "E")
+        return (
+            pred_E[0],
+            model_data["E"]["equation"],
+            model_data["E"]["degree"],
+            model_data["E"]["r2"],
+            model_data["E"]["rmse"]
+        )
+    except ValueError:
+        return None, None, None, None, None  # Return None for all outputs in case of error
+
+
+def prepare_models():
+    # Loads the saved proxy models, they are trained again (and saved) when the campaign results changed.
+    # Without campaign results the saved models are used as they are. Returns False when there are neither
+    if has_training_data():
+        if not load_models(training_data_hash()):
+            save_models()
+        return True
+    if load_models():
+        return True
+    print(f"Neither campaign results nor {config.model_file} found in {config.directory}")
+    return False
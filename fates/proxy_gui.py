@@ -0,0 +1,1386 @@
+"""
+==========================================================
+Proxy GUI
+in this section a graphical user interface will be generated
+to predict HRF and E with the proxy models and perform
+Monte Carlo Simulation
+==========================================================
+"""
+import time
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QLineEdit, QPushButton, QComboBox, QStackedWidget,
+                             QMessageBox, QFormLayout, QHBoxLayout, QSizePolicy, QProgressBar)
+
+from fates.gui import SplashScreen
+from fates.proxy import predict_all, predict_E, predict_HRF
+from fates.montecarlo import run_monte_carlo
+from fates.sensitivity import run_sensitivity
+from fates.statistics import summary_cdf, summary_histogram, summary_quantiles
+
+# Monte Carlo workers that have not finished yet, kept so that they are not destroyed while running
+running_workers = []
+
+
+# Runs one Monte Carlo simulation outside the GUI thread. progress is emitted with the partial result after every
+# batch, result_ready with the final one. requestInterruption() cancels the run after the current batch
+class MonteCarloWorker(QThread):
+    progress = pyqtSignal(object)
+    result_ready = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, ranges, year_number, sampling_method, tolerance, n_samples):
+        super().__init__()
+        self.ranges = ranges
+        self.year_number = year_number
+        self.sampling_method = sampling_method
+        self.tolerance = tolerance
+        self.n_samples = n_samples
+        self.finished.connect(lambda: running_workers.remove(self))
+        running_workers.append(self)
+
+    def run(self):
+        try:
+            result = run_monte_carlo(self.ranges, self.year_number, self.sampling_method, self.tolerance,
+                                     self.n_samples, progress=self.progress.emit,
+                                     cancelled=self.isInterruptionRequested)
+        except Exception as error:
+            self.failed.emit(str(error))
+            return
+        self.result_ready.emit(result)
+
+
+class LandingPage(QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Button, QColor("#004d73"))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        title_label = QLabel("FATES\n"
+                             "(Feasibility Assessment of Thermal Energy Storage)")
+        title_label.setFont(QFont("Arial", 40, QFont.Bold))
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("color: white;")  # White title text
+        layout.addWidget(title_label)
+
+        # HRF Prediction button
+        hrf_button = QPushButton("Predict")
+        hrf_button.setFont(QFont("Arial", 14))
+        hrf_button.setFixedWidth(300)
+        hrf_button.setStyleSheet("background-color: #004d73; color: white;")
+        hrf_button.clicked.connect(self.go_to_hrf_prediction)
+        layout.addWidget(hrf_button, alignment=Qt.AlignCenter)
+
+        # Trend button
+        hrf_button = QPushButton("Trend")
+        hrf_button.setFont(QFont("Arial", 14))
+        hrf_button.setFixedWidth(300)
+        hrf_button.setStyleSheet("background-color: #004d73; color: white;")
+        hrf_button.clicked.connect(self.go_to_hrf_trend)
+        layout.addWidget(hrf_button, alignment=Qt.AlignCenter)
+
+        # Monte-Carlo Simulation button
+        mc_button = QPushButton("Monte-Carlo Simulation")
+        mc_button.setFont(QFont("Arial", 14))
+        mc_button.setFixedWidth(300)
+        mc_button.setStyleSheet("background-color: #004d73; color: white;")
+        mc_button.clicked.connect(self.go_to_monte_carlo)
+        layout.addWidget(mc_button, alignment=Qt.AlignCenter)
+
+        self.setLayout(layout)
+
+    def go_to_hrf_prediction(self):
+        self.stacked_widget.setCurrentIndex(2)
+
+    def go_to_hrf_trend(self):
+        self.stacked_widget.setCurrentIndex(3)
+
+    def go_to_monte_carlo(self):
+        self.stacked_widget.setCurrentIndex(4)
+
+
+# Page 2 - Prediction Page
+class PredictionApp(QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+
+        self.stacked_widget = stacked_widget
+
+        self.setWindowTitle("Heat Recovery Factor Predictor")
+        self.setGeometry(100, 100, 600, 400)
+
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Button, QColor("#004d73"))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        palette.setColor(QPalette.Base, QColor("#004d73"))
+        palette.setColor(QPalette.Text, Qt.white)
+        self.setPalette(palette)
+
+        # Main layout
+        main_layout = QVBoxLayout()
+        title_label = QLabel("Heat Recovery Factor Prediction")
+        title_label.setFont(QFont("Helvetica", 18, QFont.Bold))
+        title_label.setStyleSheet("color: white;")
+        main_layout.addWidget(title_label)
+
+        # Equation and metrics
+        equation_label = QLabel("Regression Equation:")
+        equation_label.setFont(QFont("Arial", 14, QFont.Bold))
+        equation_label.setStyleSheet("color: white;")
+        main_layout.addWidget(equation_label)
+
+        # Create a placeholder for the equation text
+        self.equation_text = QLabel("")
+        self.equation_text.setFont(QFont("Arial", 12))
+        self.equation_text.setStyleSheet("color: white;")
+        self.equation_text.setWordWrap(True)
+        main_layout.addWidget(self.equation_text)
+
+        self.metrics_label = QLabel("")
+        self.metrics_label.setFont(QFont("Arial", 12))
+        self.metrics_label.setStyleSheet("color: white;")
+        main_layout.addWidget(self.metrics_label)
+
+        input_form_layout = QFormLayout()
+
+        param_info = {
+            'A': ('Injection Temperature (degC)', 60, 90),
+            'B': ('Injection Volume (m^3)', 300000, 600000),
+            'C': ('Temperature Gradient (degC/m)', 0.03, 0.04),
+            'D': ('Aquifer Longitudinal Dispersivity (m)', 0.1, 50),
+            'E': ('Desired Year', 2, 10)
+        }
+
+        self.inputs = {}
+        for param, (desc, min_val, max_val) in param_info.items():
+            desc_label = QLabel(f'{desc}:')
+            desc_label.setFont(QFont("Arial", 12))
+            desc_label.setStyleSheet("color: white;")
+            entry = QLineEdit()
+            entry.setFixedWidth(100)
+            entry.setFont(QFont("Arial", 12))
+            entry.setStyleSheet("background-color: #004d73; color: white;")
+            self.inputs[param] = entry
+
+            min_max_label = QLabel(f"(Min: {min_val}, Max: {max_val})")
+            min_max_label.setFont(QFont("Arial", 10))
+            min_max_label.setStyleSheet("color: white;")
+            param_layout = QVBoxLayout()
+            param_layout.addWidget(entry)
+            param_layout.addWidget(min_max_label)
+
+            input_form_layout.addRow(desc_label, param_layout)
+
+        main_layout.addLayout(input_form_layout)
+
+        # Predict button
+        predict_button = QPushButton("Predict")
+        predict_button.setFixedWidth(100)
+        predict_button.setFont(QFont("Arial", 12))
+        predict_button.setStyleSheet("background-color: #004d73; color: white;")
+        predict_button.clicked.connect(self.predict)
+        main_layout.addWidget(predict_button, alignment=Qt.AlignCenter)
+
+        self.result_label = QLabel("")
+        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setStyleSheet("color: white;")
+        main_layout.addWidget(self.result_label)
+
+        # Back button
+        back_button = QPushButton("Back")
+        back_button.setFixedWidth(100)
+        back_button.setFont(QFont("Arial", 12))
+        back_button.setStyleSheet("background-color: #004d73; color: white;")
+        back_button.clicked.connect(self.go_back)
+        main_layout.addWidget(back_button, alignment=Qt.AlignCenter)
+
+        self.setLayout(main_layout)
+
+    def predict(self):
+        try:
+            # Retrieve the input values from the form
+            injection_temp = float(self.inputs['A'].text())
+            injection_vol = float(self.inputs['B'].text())
+            temp_gradient = float(self.inputs['C'].text())
+            dispersivity = float(self.inputs['D'].text())
+            year_number = int(self.inputs['E'].text())
+
+            # Call the predict_HRF function
+            pred_HRF, regression_equation_HRF, degree_HRF, r2_HRF, rmse_test_HRF = predict_HRF(
+                injection_temp, injection_vol, temp_gradient, dispersivity, year_number
+            )
+
+            # Call the predict_E function
+            pred_E, regression_equation_E, degree_E, r2_E, rmse_test_E = predict_E(
+                injection_temp, injection_vol, temp_gradient, dispersivity, year_number
+            )
+
+            # Initialize result messages
+            result_message = ""
+            equation_message = ""
+            metrics_message = ""
+
+            # Display the results for HRF
+            if pred_HRF is not None:
+                result_message += f"Predicted HRF: {pred_HRF:.3f}\n"
+                equation_message += f"HRF Equation: {regression_equation_HRF}\n"
+                metrics_message += f"HRF Degree: {degree_HRF}\nR²: {r2_HRF:.3f}\nRMSE: {rmse_test_HRF:.3f}\n"
+            else:
+                result_message += "Invalid input for HRF. Please enter valid numbers.\n"
+
+            # Display the results for E
+            if pred_E is not None:
+                result_message += f"Predicted E: {pred_E:.3f}\n"
+                equation_message += f"E Equation: {regression_equation_E}\n"
+                metrics_message += f"E Degree: {degree_E}\nR²: {r2_E:.3f}\nRMSE: {rmse_test_E:.3f}\n"
+            else:
+                result_message += "Invalid input for E. Please enter valid numbers.\n"
+
+            # Update the labels with the results
+            self.result_label.setText(result_message.strip())
+            self.equation_text.setText(equation_message.strip())
+            self.metrics_label.setText(metrics_message.strip())
+
+        except ValueError:
+            self.result_label.setText("Invalid input. Please enter valid numbers.")
+
+    def go_back(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+
+class PredictionApp1(QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+
+        self.stacked_widget = stacked_widget
+
+        self.setWindowTitle("Heat Recovery Factor Predictor")
+        self.setGeometry(100, 100, 600, 400)
+
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Button, QColor("#004d73"))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        palette.setColor(QPalette.Base, QColor("#004d73"))
+        palette.setColor(QPalette.Text, Qt.white)
+        self.setPalette(palette)
+
+        # Main layout
+        main_layout = QVBoxLayout()
+        title_label = QLabel("Heat Recovery Factor Prediction")
+        title_label.setFont(QFont("Helvetica", 18, QFont.Bold))
+        title_label.setStyleSheet("color: white;")
+        main_layout.addWidget(title_label)
+
+        self.equation_text = QLabel("")
+        self.equation_text.setFont(QFont("Arial", 12))
+        self.equation_text.setStyleSheet("color: white;")
+        self.equation_text.setWordWrap(True)
+        main_layout.addWidget(self.equation_text)
+
+        self.metrics_label = QLabel("")
+        self.metrics_label.setFont(QFont("Arial", 12))
+        self.metrics_label.setStyleSheet("color: white;")
+        main_layout.addWidget(self.metrics_label)
+
+        input_form_layout = QFormLayout()
+        param_info = {
+            'A': ('Injection Temperature (degC)', 60, 90),
+            'B': ('Injection Volume (m^3)', 300000, 600000),
+            'C': ('Temperature Gradient (degC/m)', 0.03, 0.04),
+            'D': ('Aquifer Longitudinal Dispersivity (m)', 0.1, 50),
+        }
+
+        self.inputs = {}
+        for param, (desc, min_val, max_val) in param_info.items():
+            desc_label = QLabel(f'{desc}:')
+            desc_label.setFont(QFont("Arial", 12))
+            desc_label.setStyleSheet("color: white;")
+            entry = QLineEdit()
+            entry.setFixedWidth(100)
+            entry.setFont(QFont("Arial", 12))
+            entry.setStyleSheet("background-color: #004d73; color: white;")
+            self.inputs[param] = entry
+
+            min_max_label = QLabel(f"(Min: {min_val}, Max: {max_val})")
+            min_max_label.setFont(QFont("Arial", 10))
+            min_max_label.setStyleSheet("color: white;")
+
+            param_layout = QVBoxLayout()
+            param_layout.addWidget(entry)
+            param_layout.addWidget(min_max_label)
+
+            input_form_layout.addRow(desc_label, param_layout)
+
+        main_layout.addLayout(input_form_layout)
+
+        # Plot Graph button
+        plot_graph_button = QPushButton("Plot Graph")
+        plot_graph_button.setFixedWidth(200)
+        plot_graph_button.setFont(QFont("Arial", 12))
+        plot_graph_button.setStyleSheet("background-color: #004d73; color: white;")
+        plot_graph_button.clicked.connect(self.plot_graph)
+        main_layout.addWidget(plot_graph_button, alignment=Qt.AlignCenter)
+
+        self.result_label = QLabel("")
+        self.result_label.setFont(QFont("Arial", 12))
+        self.result_label.setStyleSheet("color: white;")
+        main_layout.addWidget(self.result_label)
+
+        # Back button
+        back_button = QPushButton("Back")
+        back_button.setFixedWidth(100)
+        back_button.setFont(QFont("Arial", 12))
+        back_button.setStyleSheet("background-color: #004d73; color: white;")
+        back_button.clicked.connect(self.go_back)
+        main_layout.addWidget(back_button, alignment=Qt.AlignCenter)
+
+        self.setLayout(main_layout)
+
+    def plot_graph(self):
+        try:
+            # Retrieve the input values from the form
+            injection_temp = float(self.inputs['A'].text())
+            injection_vol = float(self.inputs['B'].text())
+            temp_gradient = float(self.inputs['C'].text())
+            dispersivity = float(self.inputs['D'].text())
+
+            # Predict HRF and E of all years in one pass
+            predictions = predict_all([[injection_temp, injection_vol, temp_gradient, dispersivity]])[0]
+            hrf_results = list(predictions[:9])
+            e_results = list(predictions[9:])
+            # Display the results for HRF and E
+            if all(hrf is not None for hrf in hrf_results) and all(e is not None for e in e_results):
+                hrf2, hrf3, hrf4, hrf5, hrf6, hrf7, hrf8, hrf9, hrf10 = hrf_results
+                e2, e3, e4, e5, e6, e7, e8, e9, e10 = e_results
+                self.result_label.setText(
+                    f"Predicted HRF2: {hrf2:.3f}, HRF3: {hrf3:.3f}, HRF4: {hrf4:.3f}, HRF5: {hrf5:.3f},"
+                    f" HRF6: {hrf6:.3f}, HRF7: {hrf7:.3f}, HRF8: {hrf8:.3f}, HRF9: {hrf9:.3f}, HRF10: {hrf10:.3f}\n"
+                    f"Predicted E2: {e2:.3f}, E3: {e3:.3f}, E4: {e4:.3f}, E5: {e5:.3f}, E6: {e6:.3f}, E7: {e7:.3f},"
+                    f" E8: {e8:.3f}, E9: {e9:.3f}, E10: {e10:.3f}"
+                )
+                self.plot_trend_graph(hrf_results, e_results)
+            else:
+                self.result_label.setText("Invalid input. Please enter valid numbers.")
+        except ValueError:
+            self.result_label.setText("No")
+
+    def plot_trend_graph(self, hrf_results, e_results):
+        years = [2, 3, 4, 5, 6, 7, 8, 9, 10]
+
+        fig, axs = plt.subplots(1, 2, figsize=(12, 5))
+
+        # Plot HRF
+        axs[0].plot(years, hrf_results, marker='o', linestyle='-', color='blue')
+        axs[0].set_xlabel('Time (year)')
+        axs[0].set_ylabel('HRF')
+        axs[0].set_xticks(years)
+        axs[0].grid()
+        axs[0].legend()
+
+        # Plot E
+        axs[1].plot(years, e_results, marker='o', linestyle='-', color='green')
+        axs[1].set_xlabel('Time (year)')
+        axs[1].set_ylabel('Heat Production (GWh/year)')
+        axs[1].set_xticks(years)
+        axs[1].grid()
+        axs[1].legend()
+
+        plt.tight_layout()
+        plt.show()
+
+    def go_back(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+
+class Page2DistributionType(QWidget):
+    sampling_methods = {"Pseudo-random": 'random', "Sobol (quasi-random)": 'sobol', "Halton (quasi-random)": 'halton'}
+
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.dist_types = {}
+        self.year_number = None
+        self.sampling_method = 'random'
+        self.n_samples = 100000
+        self.tolerance = 0.005
+        self.initUI()
+
+    def initUI(self):
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        layout.addStretch(1)
+
+        title_label = QLabel("Select Distribution Type for Each Parameter")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("color: white;")
+        layout.addWidget(title_label)
+
+        form_layout = QFormLayout()
+        self.dist_type_combos = {}
+        parameters = ['Injection Temperature (degC)', 'Injection Volume (m^3)', 'Temperature Gradient (degC/m)',
+                      'Aquifer Longitudinal Dispersivity (m)']
+
+        combo_style = """
+            QComboBox {
+                padding: 5px;
+                border: 1px solid #004d73;  /* Change border color to match the theme */
+                border-radius: 4px;
+                min-width: 100px;
+                text-align: center;
+                background-color: #003c54;  /* Darker background for combo box */
+                color: white;                /* White text inside combo box */
+            }
+            QComboBox::drop-down {
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
+                width: 0px; 
+            }
+            QComboBox::down-arrow {
+                image: none;
+            }
+        """
+
+        for param in parameters:
+            label = QLabel(f"{param}:")
+            label.setStyleSheet("color: white;")
+            combo = QComboBox()
+            combo.addItems(["normal", "uniform", "triangular", "exponential", "lognormal"])
+            combo.setStyleSheet(combo_style)
+            self.dist_type_combos[param] = combo
+            form_layout.addRow(label, combo)
+
+        year_label = QLabel("Desired Year:")
+        year_label.setStyleSheet("color: white;")
+        self.year_entry = QLineEdit()
+        self.year_entry.setPlaceholderText("Enter the desired year")
+        self.year_entry.setStyleSheet("""
+            QLineEdit {
+                padding: 5px;
+                border: 1px solid #004d73;
+                border-radius: 4px;
+                font-size: 14px;
+                background-color: #003c54;
+                color: white;
+            }
+        """)
+        form_layout.addRow(year_label, self.year_entry)
+
+        # Sampling method and number of samples, quasi-random points converge with far fewer samples
+        method_label = QLabel("Sampling Method:")
+        method_label.setStyleSheet("color: white;")
+        self.method_combo = QComboBox()
+        self.method_combo.addItems(list(self.sampling_methods))
+        self.method_combo.setStyleSheet(combo_style)
+        form_layout.addRow(method_label, self.method_combo)
+
+        samples_label = QLabel("Maximum Number of Samples:")
+        samples_label.setStyleSheet("color: white;")
+        self.samples_entry = QLineEdit(str(self.n_samples))
+        self.samples_entry.setStyleSheet(self.year_entry.styleSheet())
+        form_layout.addRow(samples_label, self.samples_entry)
+
+        # Sampling stops when P10, P50, P90 and the mean are known within the tolerance (0 draws all samples)
+        tolerance_label = QLabel("Tolerance (%):")
+        tolerance_label.setStyleSheet("color: white;")
+        self.tolerance_entry = QLineEdit(str(100 * self.tolerance))
+        self.tolerance_entry.setStyleSheet(self.year_entry.styleSheet())
+        form_layout.addRow(tolerance_label, self.tolerance_entry)
+
+        form_container = QWidget()
+        form_container.setLayout(form_layout)
+        form_container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        layout.addWidget(form_container, alignment=Qt.AlignCenter)
+
+        layout.addStretch(1)
+
+        button_layout = QHBoxLayout()
+        button_layout.setAlignment(Qt.AlignCenter)
+
+        # Back Button
+        back_button = QPushButton('Back', self)
+        back_button.setStyleSheet(
+            "QPushButton { background-color: #004d73; color: white; padding: 10px 24px; border: none;"
+            " border-radius: 5px; font-size: 16px; } QPushButton:hover { background-color: #003d61; }")
+        back_button.clicked.connect(self.go_back)
+        button_layout.addWidget(back_button)
+
+        # Next Button
+        next_button = QPushButton('Next', self)
+        next_button.setStyleSheet(
+            "QPushButton { background-color: #004d73; color: white; padding: 10px 24px; border: none;"
+            " border-radius: 5px; font-size: 16px; } QPushButton:hover { background-color: #003d61; }")
+        next_button.clicked.connect(self.save_and_go)
+        button_layout.addWidget(next_button)
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def go_back(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+    def save_and_go(self):
+        # Save selected distribution types
+        self.dist_types = {param: self.dist_type_combos[param].currentText() for param in self.dist_type_combos}
+
+        # Save the entered year
+        try:
+            self.year_number = int(self.year_entry.text())
+        except ValueError:
+            QMessageBox.warning(self, "Input Error", "Please enter a valid year number.")
+            return
+
+        # Save the sampling method and the number of samples
+        self.sampling_method = self.sampling_methods[self.method_combo.currentText()]
+        try:
+            self.n_samples = int(self.samples_entry.text())
+        except ValueError:
+            self.n_samples = 0
+        if self.n_samples < 1:
+            QMessageBox.warning(self, "Input Error", "Please enter a valid number of samples.")
+            return
+        try:
+            self.tolerance = float(self.tolerance_entry.text()) / 100
+        except ValueError:
+            self.tolerance = -1
+        if self.tolerance < 0:
+            QMessageBox.warning(self, "Input Error", "Please enter a valid tolerance.")
+            return
+
+        # Check if Page2Parameters exists and remove it
+        if self.stacked_widget.count() >= 3:
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(4))
+
+        # Add a new Page2Parameters and pass the year_number
+        self.stacked_widget.addWidget(Page2Parameters(self.stacked_widget, self.dist_types, self.year_number,
+                                                      self.sampling_method, self.n_samples, self.tolerance))
+        self.stacked_widget.setCurrentIndex(4)
+
+
+class Page2Parameters(QWidget):
+    def __init__(self, stacked_widget, dist_types, year_number, sampling_method='random', n_samples=100000,
+                 tolerance=0.005):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.dist_types = dist_types
+        self.year_number = year_number  # Store the passed year number
+        self.sampling_method = sampling_method
+        self.n_samples = n_samples
+        self.tolerance = tolerance
+        self.worker = None
+        self.result_pages = []  # Page3 and Page4 of the current scenario
+        self.last_drawn = 0  # time.monotonic() of the last drawn results
+        self.mean_entries = {}
+        self.std_entries = {}
+        self.min_entries = {}
+        self.max_entries = {}
+        self.mode_entries = {}
+        self.initUI()
+
+    def initUI(self):
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        layout.addStretch(1)
+
+        title_label = QLabel("Input Parameter Ranges")
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("color: white; font-size: 18px; font-weight: bold;")
+        layout.addWidget(title_label)
+
+        form_layout = QFormLayout()
+        line_edit_style = """
+            QLineEdit {
+                padding: 5px;
+                border: 1px solid #004d73;
+                border-radius: 4px;
+                font-size: 14px;
+                background-color: #003c54;
+                color: white;
+            }
+        """
+        label_style = "color: white; font-size: 14px;"  # White text for labels
+
+        for param, dist_type in self.dist_types.items():
+            if dist_type in ["normal"]:
+                mean_entry = QLineEdit()
+                std_entry = QLineEdit()
+                min_entry = QLineEdit()
+                max_entry = QLineEdit()
+                mean_entry.setStyleSheet(line_edit_style)
+                std_entry.setStyleSheet(line_edit_style)
+                min_entry.setStyleSheet(line_edit_style)
+                max_entry.setStyleSheet(line_edit_style)
+
+                mean_label = QLabel(f"{param} Mean:")
+                mean_label.setStyleSheet(label_style)
+                std_label = QLabel(f"{param} Std:")
+                std_label.setStyleSheet(label_style)
+                min_label = QLabel(f"{param} Min:")
+                min_label.setStyleSheet(label_style)
+                max_label = QLabel(f"{param} Max:")
+                max_label.setStyleSheet(label_style)
+
+                form_layout.addRow(mean_label, mean_entry)
+                form_layout.addRow(std_label, std_entry)
+                form_layout.addRow(min_label, min_entry)
+                form_layout.addRow(max_label, max_entry)
+
+                self.mean_entries[param] = mean_entry
+                self.std_entries[param] = std_entry
+                self.min_entries[param] = min_entry
+                self.max_entries[param] = max_entry
+
+            elif dist_type == "triangular":
+                min_entry = QLineEdit()
+                max_entry = QLineEdit()
+                mode_entry = QLineEdit()
+                min_entry.setStyleSheet(line_edit_style)
+                max_entry.setStyleSheet(line_edit_style)
+                mode_entry.setStyleSheet(line_edit_style)
+
+                min_label = QLabel(f"{param} Min:")
+                min_label.setStyleSheet(label_style)
+                max_label = QLabel(f"{param} Max:")
+                max_label.setStyleSheet(label_style)
+                mode_label = QLabel(f"{param} Mode:")
+                mode_label.setStyleSheet(label_style)
+
+                form_layout.addRow(min_label, min_entry)
+                form_layout.addRow(max_label, max_entry)
+                form_layout.addRow(mode_label, mode_entry)
+
+                self.min_entries[param] = min_entry
+                self.max_entries[param] = max_entry
+                self.mode_entries[param] = mode_entry
+
+            elif dist_type == "exponential":
+                mean_entry = QLineEdit()
+                mean_entry.setStyleSheet(line_edit_style)
+                mean_label = QLabel(f"{param} Mean (1/lambda):")
+                mean_label.setStyleSheet(label_style)
+                form_layout.addRow(mean_label, mean_entry)
+                self.mean_entries[param] = mean_entry
+
+            elif dist_type == "lognormal":
+                shape_entry = QLineEdit()
+                scale_entry = QLineEdit()
+                min_entry = QLineEdit()
+                max_entry = QLineEdit()
+                shape_entry.setStyleSheet(line_edit_style)
+                scale_entry.setStyleSheet(line_edit_style)
+                min_entry.setStyleSheet(line_edit_style)
+                max_entry.setStyleSheet(line_edit_style)
+
+                min_label = QLabel(f"{param} Min:")
+                min_label.setStyleSheet(label_style)
+                max_label = QLabel(f"{param} Max:")
+                max_label.setStyleSheet(label_style)
+                shape_label = QLabel(f"{param} Shape (σ):")
+                shape_label.setStyleSheet(label_style)
+                scale_label = QLabel(f"{param} Scale (exp(μ)):")
+                scale_label.setStyleSheet(label_style)
+
+                form_layout.addRow(min_label, min_entry)
+                form_layout.addRow(max_label, max_entry)
+                form_layout.addRow(shape_label, shape_entry)
+                form_layout.addRow(scale_label, scale_entry)
+
+                self.min_entries[param] = min_entry
+                self.max_entries[param] = max_entry
+                self.mean_entries[param] = shape_entry
+                self.std_entries[param] = scale_entry
+
+            else:  # uniform distribution
+                min_entry = QLineEdit()
+                max_entry = QLineEdit()
+                min_entry.setStyleSheet(line_edit_style)
+                max_entry.setStyleSheet(line_edit_style)
+
+                min_label = QLabel(f"{param} Min:")
+                min_label.setStyleSheet(label_style)
+                max_label = QLabel(f"{param} Max:")
+                max_label.setStyleSheet(label_style)
+
+                form_layout.addRow(min_label, min_entry)
+                form_layout.addRow(max_label, max_entry)
+
+                self.min_entries[param] = min_entry
+                self.max_entries[param] = max_entry
+
+        form_container = QWidget()
+        form_container.setLayout(form_layout)
+        form_container.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
+        layout.addWidget(form_container, alignment=Qt.AlignCenter)
+
+        layout.addStretch(1)
+
+        # Button layout and style
+        button_layout = QHBoxLayout()
+        button_layout.setAlignment(Qt.AlignCenter)
+
+        back_button = QPushButton('Back', self)
+        back_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 20px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        back_button.clicked.connect(self.go_back)
+        button_layout.addWidget(back_button)
+
+        next_button = QPushButton('Next', self)
+        next_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 20px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        next_button.clicked.connect(self.save_and_calculate)
+        button_layout.addWidget(next_button)
+
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def go_back(self):
+        # The scenario still running would add its pages once its first batch arrives
+        self.stop_worker()
+        # Remove current and upper pages
+        while self.stacked_widget.currentIndex() + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.currentIndex() + 1))
+        # Navigate to the previous page
+        self.stacked_widget.setCurrentIndex(self.stacked_widget.currentIndex() - 1)
+
+    def stop_worker(self):
+        # Cancels the running scenario, its remaining results are not shown
+        if self.worker is None:
+            return
+        self.worker.requestInterruption()
+        self.worker.progress.disconnect()
+        self.worker.result_ready.disconnect()
+        self.worker.failed.disconnect()
+        self.worker = None
+        self.result_pages = []
+
+    def save_and_calculate(self):
+        ranges = {}
+
+        for param, dist_type in self.dist_types.items():
+            try:
+                if dist_type == "normal":
+                    mean_val = float(self.mean_entries[param].text())
+                    std_val = float(self.std_entries[param].text())
+                    min_val = float(self.min_entries[param].text())
+                    max_val = float(self.max_entries[param].text())
+                    ranges[param] = {
+                        'mean': mean_val,
+                        'std': std_val,
+                        'min': min_val,
+                        'max': max_val,
+                        'dist_type': dist_type,
+                        'mode': None
+                    }
+
+                elif dist_type == "triangular":
+                    min_val = float(self.min_entries[param].text())
+                    max_val = float(self.max_entries[param].text())
+                    mode_val = float(self.mode_entries[param].text())
+                    ranges[param] = {
+                        'min': min_val,
+                        'max': max_val,
+                        'mode': mode_val,
+                        'dist_type': dist_type,
+                        'mean': None,
+                        'std': None
+                    }
+
+                elif dist_type == "exponential":
+                    mean_val = float(self.mean_entries[param].text())
+                    ranges[param] = {
+                        'min': None,
+                        'max': None,
+                        'mode': None,
+                        'dist_type': dist_type,
+                        'mean': mean_val,
+                        'std': None
+                    }
+
+                elif dist_type == "lognormal":
+                    min_val = float(self.min_entries[param].text())
+                    max_val = float(self.max_entries[param].text())
+                    shape_val = float(self.mean_entries[param].text())
+                    scale_val = float(self.std_entries[param].text())
+                    ranges[param] = {
+                        'min': min_val,
+                        'max': max_val,
+                        'mode': None,
+                        'dist_type': dist_type,
+                        'mean': shape_val,
+                        'std': scale_val,
+                    }
+
+                elif dist_type == "uniform":
+                    min_val = float(self.min_entries[param].text())
+                    max_val = float(self.max_entries[param].text())
+                    ranges[param] = {
+                        'min': min_val,
+                        'max': max_val,
+                        'dist_type': dist_type,
+                        'mean': None,
+                        'std': None,
+                        'mode': None
+                    }
+
+            except ValueError:
+                QMessageBox.warning(self, "Input Error", f"Please enter valid values for {param}.")
+                return
+
+        # A new scenario replaces the one still running and its pages
+        self.stop_worker()
+        while self.stacked_widget.indexOf(self) + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.indexOf(self) + 1))
+
+        # Sample the inputs and predict HRF and E in the background until their statistics are within the tolerance,
+        # Page3 and Page4 are added with the first batch and updated with every further one
+        self.worker = MonteCarloWorker(ranges, self.year_number, self.sampling_method, self.tolerance, self.n_samples)
+        self.worker.progress.connect(self.show_progress)
+        self.worker.result_ready.connect(self.show_results)
+        self.worker.failed.connect(lambda message: QMessageBox.warning(self, "Monte Carlo Error", message))
+        self.worker.start()
+
+    def show_progress(self, result):
+        # Partial results are drawn at most twice a second, long runs report a chunk every few milliseconds
+        if time.monotonic() - self.last_drawn >= 0.5:
+            self.show_results(result)
+
+    def show_results(self, result):
+        if self.sender() is not self.worker:  # Results already queued by a stopped scenario
+            return
+        if self.result_pages:
+            for page in self.result_pages:
+                page.update_results(result)
+            self.last_drawn = time.monotonic()
+            return
+
+        # Add Page3 and Page4 with the first results
+        self.result_pages = [Page3(self.stacked_widget, result['summaries']),
+                             Page4(self.stacked_widget, result, self.year_number, self.worker, self.worker.ranges)]
+        for page in self.result_pages:
+            self.stacked_widget.addWidget(page)
+        self.stacked_widget.setCurrentWidget(self.result_pages[0])
+        self.last_drawn = time.monotonic()
+
+
+class Page3(QWidget):
+    def __init__(self, stacked_widget, summaries):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.summaries = summaries  # Histograms of the sampled inputs
+        self.initUI()
+
+    def initUI(self):
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+
+        # Create the figure and subplots
+        self.fig1, self.axs1 = plt.subplots(2, 2, figsize=(10, 8))
+        self.plot_samples()
+
+        self.canvas1 = FigureCanvas(self.fig1)
+        layout.addWidget(self.canvas1)
+
+        button_layout = QHBoxLayout()
+
+        # Back button
+        back_button = QPushButton('Back', self)
+        back_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        back_button.clicked.connect(self.go_back)
+        button_layout.addWidget(back_button)
+
+        # Next button
+        next_button = QPushButton('Next', self)
+        next_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        next_button.clicked.connect(self.go_to_next)
+        button_layout.addWidget(next_button)
+
+        layout.addLayout(button_layout)
+
+        self.setLayout(layout)
+
+    def go_back(self):
+        # Remove current and upper pages
+        while self.stacked_widget.currentIndex() + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.currentIndex() + 1))
+        # Navigate to the previous page
+        self.stacked_widget.setCurrentIndex(self.stacked_widget.currentIndex() - 1)
+
+    def plot_samples(self):
+        axs1 = self.axs1
+        for ax in axs1.flat:
+            ax.clear()
+
+        # Plot 1: Injection Temperature (degC)
+        axs1[0, 0].stairs(*summary_histogram(self.summaries['Injection Temperature (degC)'], 128), fill=True,
+                          color='b', alpha=0.7)
+        axs1[0, 0].set_xlabel('Injection Temperature (degC)', fontsize=12, color='white')
+        axs1[0, 0].set_ylabel('Frequency', fontsize=12, color='white')
+        axs1[0, 0].set_xlim(self.summaries['Injection Temperature (degC)']['min'],
+                            self.summaries['Injection Temperature (degC)']['max'])
+        axs1[0, 0].set_facecolor('white')
+        axs1[0, 0].tick_params(colors='white')
+
+        # Plot 2: Injection Volume (m^3)
+        axs1[0, 1].stairs(*summary_histogram(self.summaries['Injection Volume (m^3)'], 128), fill=True,
+                          color='g', alpha=0.7)
+        axs1[0, 1].set_xlabel('Injection Volume (m^3)', fontsize=12, color='white')
+        axs1[0, 1].set_ylabel('Frequency', fontsize=12, color='white')
+        axs1[0, 1].set_xlim(self.summaries['Injection Volume (m^3)']['min'],
+                            self.summaries['Injection Volume (m^3)']['max'])
+        axs1[0, 1].set_facecolor('white')
+        axs1[0, 1].tick_params(colors='white')
+
+        # Plot 3: Temperature Gradient (degC/m)
+        axs1[1, 0].stairs(*summary_histogram(self.summaries['Temperature Gradient (degC/m)'], 128), fill=True,
+                          color='m', alpha=0.7)
+        axs1[1, 0].set_xlabel('Temperature Gradient (degC/m)', fontsize=12, color='white')
+        axs1[1, 0].set_ylabel('Frequency', fontsize=12, color='white')
+        axs1[1, 0].set_xlim(self.summaries['Temperature Gradient (degC/m)']['min'],
+                            self.summaries['Temperature Gradient (degC/m)']['max'])
+        axs1[1, 0].set_facecolor('white')
+        axs1[1, 0].tick_params(colors='white')
+
+        # Plot 4: Aquifer Longitudinal Dispersivity (m)
+        axs1[1, 1].stairs(*summary_histogram(self.summaries['Aquifer Longitudinal Dispersivity (m)'], 128), fill=True,
+                          color='r', alpha=0.7)
+        axs1[1, 1].set_xlabel('Aquifer Longitudinal Dispersivity (m)', fontsize=12, color='white')
+        axs1[1, 1].set_ylabel('Frequency', fontsize=12, color='white')
+        axs1[1, 1].set_xlim(self.summaries['Aquifer Longitudinal Dispersivity (m)']['min'],
+                            self.summaries['Aquifer Longitudinal Dispersivity (m)']['max'])
+        axs1[1, 1].set_facecolor('white')
+        axs1[1, 1].tick_params(colors='white')
+
+        self.fig1.tight_layout()
+        self.fig1.patch.set_facecolor('#001f3f')
+
+    def update_results(self, result):
+        self.summaries = result['summaries']
+        self.plot_samples()
+        self.canvas1.draw_idle()
+
+    def go_to_next(self):
+        self.stacked_widget.setCurrentIndex(6)
+
+
+class Page4(QWidget):
+    def __init__(self, stacked_widget, result, year_number, worker=None, ranges=None):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.result = result  # Summaries and confidence intervals of the Monte Carlo simulation
+        self.year_number = year_number
+        self.worker = worker  # MonteCarloWorker still adding samples, if any
+        self.ranges = ranges  # Input distributions, for the sensitivity analysis
+        self.initUI()
+
+    def initUI(self):
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        self.fig, (self.ax_HRF, self.ax_E) = plt.subplots(1, 2, figsize=(18, 6), gridspec_kw={'wspace': 0.4})
+        self.ax_HRF_twin = self.ax_HRF.twinx()
+        self.ax_E_twin = self.ax_E.twinx()
+        self.plot_results()
+
+        self.canvas = FigureCanvas(self.fig)
+        layout.addWidget(self.canvas)
+
+        # Progress of a running simulation and 95 % confidence intervals of the statistics
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setTextVisible(False)
+        layout.addWidget(self.progress_bar)
+        self.status_label = QLabel(self)
+        self.status_label.setAlignment(Qt.AlignCenter)
+        self.status_label.setStyleSheet("color: white; font-size: 14px;")
+        layout.addWidget(self.status_label)
+
+        button_layout = QHBoxLayout()
+
+        # Back button - navigate to the previous page
+        back_button = QPushButton('Back', self)
+        back_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        back_button.clicked.connect(self.go_back)
+        button_layout.addWidget(back_button)
+
+        home_button = QPushButton('Go to Home', self)
+        home_button.setStyleSheet(
+            """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+        )
+        home_button.clicked.connect(self.go_to_page_0)
+        button_layout.addWidget(home_button)
+
+        # Sensitivity button - Sobol indices of the inputs for the same distributions
+        if self.ranges is not None:
+            sensitivity_button = QPushButton('Sensitivity', self)
+            sensitivity_button.setStyleSheet(home_button.styleSheet())
+            sensitivity_button.clicked.connect(self.go_to_sensitivity)
+            button_layout.addWidget(sensitivity_button)
+
+        # Cancel button - stops the simulation after the current batch
+        self.cancel_button = QPushButton('Cancel', self)
+        self.cancel_button.setStyleSheet(home_button.styleSheet())
+        self.cancel_button.clicked.connect(self.cancel)
+        button_layout.addWidget(self.cancel_button)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+        self.show_status()
+
+    def plot_results(self):
+        ax_HRF, ax_E, ax_HRF_twin, ax_E_twin = self.ax_HRF, self.ax_E, self.ax_HRF_twin, self.ax_E_twin
+        for ax in [ax_HRF, ax_E, ax_HRF_twin, ax_E_twin]:
+            ax.clear()
+        HRF = self.result['summaries'][f'HRF{self.year_number}']
+        E = self.result['summaries'][f'E{self.year_number}']
+
+        # -------- Plot HRF Results --------
+        ax_HRF.stairs(*summary_histogram(HRF, 64, density=True), fill=True, color='g', alpha=0.7)
+        ax_HRF.plot(*self.result['kde'][f'HRF{self.year_number}'], color='g', linewidth=2)
+        ax_HRF.set_xlim(HRF['min'], HRF['max'])
+        ax_HRF.set_facecolor('white')
+        ax_HRF.tick_params(colors='black')
+        ax_HRF.set_xlabel('Heat Recovery Factor (HRF)', fontsize=12, color='black')
+        ax_HRF.set_ylabel('Density', fontsize=12, color='black')
+
+        # Plot cumulative density (ECDF) for HRF
+        ax_HRF_twin.plot(*summary_cdf(HRF), 'b-', linewidth=2, label='Cumulative Density')
+        ax_HRF_twin.set_ylabel('Cumulative Density', color='b')
+        ax_HRF_twin.set_ylim(0, 1)
+        ax_HRF_twin.tick_params(colors='black')
+
+        # Calculate P10, P50, P90 for HRF
+        P10_HRF, P50_HRF, P90_HRF = summary_quantiles(HRF, [0.1, 0.5, 0.9])
+
+        # Add P10, P50, P90 lines and annotations for HRF
+        ax_HRF_twin.axhline(0.10, color='b', linestyle='--', linewidth=1)
+        ax_HRF_twin.axhline(0.50, color='b', linestyle='--', linewidth=1)
+        ax_HRF_twin.axhline(0.90, color='b', linestyle='--', linewidth=1)
+        xmax_HRF = ax_HRF.get_xlim()[1]
+        ax_HRF_twin.text(xmax_HRF, 0.10, f'P10: {P10_HRF:.2f}', color='b', va='center', ha='right', backgroundcolor='w')
+        ax_HRF_twin.text(xmax_HRF, 0.50, f'P50: {P50_HRF:.2f}', color='b', va='center', ha='right', backgroundcolor='w')
+        ax_HRF_twin.text(xmax_HRF, 0.90, f'P90: {P90_HRF:.2f}', color='b', va='center', ha='right', backgroundcolor='w')
+
+        # -------- Plot E Results --------
+        ax_E.stairs(*summary_histogram(E, 64, density=True), fill=True, color='r', alpha=0.7)
+        ax_E.plot(*self.result['kde'][f'E{self.year_number}'], color='r', linewidth=2)
+        ax_E.set_xlim(E['min'], E['max'])
+        ax_E.set_facecolor('white')
+        ax_E.tick_params(colors='black')
+        ax_E.set_xlabel('Heat Production (GWh/year)', fontsize=12, color='black')
+        ax_E.set_ylabel('Density', fontsize=12, color='black')
+
+        # Plot cumulative density (ECDF) for E
+        ax_E_twin.plot(*summary_cdf(E), 'b-', linewidth=2, label='Cumulative Density')
+        ax_E_twin.set_ylabel('Cumulative Density', color='b')
+        ax_E_twin.set_ylim(0, 1)
+        ax_E_twin.tick_params(colors='black')
+
+        # Calculate P10, P50, P90 for E
+        P10_E, P50_E, P90_E = summary_quantiles(E, [0.1, 0.5, 0.9])
+
+        # Add P10, P50, P90 lines and annotations for E
+        ax_E_twin.axhline(0.10, color='b', linestyle='--', linewidth=1)
+        ax_E_twin.axhline(0.50, color='b', linestyle='--', linewidth=1)
+        ax_E_twin.axhline(0.90, color='b', linestyle='--', linewidth=1)
+        xmax_E = ax_E.get_xlim()[1]
+        ax_E_twin.text(xmax_E, 0.10, f'P10: {P10_E:.2f} GWh', color='b', va='center', ha='right', backgroundcolor='w')
+        ax_E_twin.text(xmax_E, 0.50, f'P50: {P50_E:.2f} GWh', color='b', va='center', ha='right', backgroundcolor='w')
+        ax_E_twin.text(xmax_E, 0.90, f'P90: {P90_E:.2f} GWh', color='b', va='center', ha='right', backgroundcolor='w')
+
+    def show_status(self):
+        running = self.worker is not None and self.result is not None and not self.result['converged'] \
+            and not self.result['cancelled'] and self.result['n_samples'] < self.result['max_samples']
+        self.progress_bar.setVisible(running)
+        self.cancel_button.setVisible(running)
+        if self.result is None:
+            self.status_label.setText("")
+            return
+        if running:
+            self.progress_bar.setMaximum(self.result['max_samples'])
+            self.progress_bar.setValue(self.result['n_samples'])
+            state = f"of at most {self.result['max_samples']}, running"
+        elif self.result['cancelled']:
+            state = "cancelled"
+        elif self.result['converged']:
+            state = "converged"
+        else:
+            state = "not converged within the tolerance"
+        lines = [f"{self.result['n_samples']} samples, {state}"]
+        for response, unit in [('HRF', ''), ('E', ' GWh')]:
+            lines.append(f"{response}: " + ", ".join(
+                f"{name} {value:.3f} [{low:.3f}, {high:.3f}]{unit}"
+                for name, (value, low, high) in self.result['intervals'][f'{response}{self.year_number}'].items()))
+        self.status_label.setText("\n".join(lines))
+
+    def update_results(self, result):
+        self.result = result
+        self.plot_results()
+        self.canvas.draw_idle()
+        self.show_status()
+
+    def cancel(self):
+        self.worker.requestInterruption()
+        self.cancel_button.setEnabled(False)
+
+    def go_back(self):
+        while self.stacked_widget.currentIndex() + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.currentIndex() + 1))
+        self.stacked_widget.setCurrentIndex(self.stacked_widget.currentIndex() - 1)
+
+    def go_to_page_0(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+    def go_to_sensitivity(self):
+        # A Sobol index analysis takes a fraction of a second on the proxy, it runs on the spot
+        indices = run_sensitivity(self.ranges, self.year_number)
+        while self.stacked_widget.indexOf(self) + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.indexOf(self) + 1))
+        sensitivity_page = SensitivityPage(self.stacked_widget, indices, self.year_number)
+        self.stacked_widget.addWidget(sensitivity_page)
+        self.stacked_widget.setCurrentWidget(sensitivity_page)
+
+
+class SensitivityPage(QWidget):
+    def __init__(self, stacked_widget, indices, year_number):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+        self.indices = indices  # Sobol indices of every input for HRF and E
+        self.year_number = year_number
+        self.initUI()
+
+    def initUI(self):
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        fig, axes = plt.subplots(1, 2, figsize=(18, 6), gridspec_kw={'wspace': 0.3})
+
+        # First-order and total-effect index of every input with their 95 % confidence intervals
+        for ax, (response, label) in zip(axes, [('HRF', 'Heat Recovery Factor (HRF)'),
+                                                ('E', 'Heat Production (GWh/year)')]):
+            indices = self.indices[f'{response}{self.year_number}']
+            positions = np.arange(len(indices))
+            for offset, (index, name, color) in zip([-0.2, 0.2], [('S1', 'First-order', 'b'),
+                                                                  ('ST', 'Total-effect', 'r')]):
+                values = np.array([indices[param][index] for param in indices])
+                errors = np.maximum([values[:, 0] - values[:, 1], values[:, 2] - values[:, 0]], 0)
+                ax.bar(positions + offset, values[:, 0], width=0.4, yerr=errors, capsize=4, color=color, alpha=0.7,
+                       label=name)
+            ax.set_xticks(positions, [param.replace(' (', '\n(') for param in indices], fontsize=10)
+            ax.set_facecolor('white')
+            ax.tick_params(colors='black')
+            ax.set_xlabel(label, fontsize=12, color='black')
+            ax.set_ylabel('Sobol Index', fontsize=12, color='black')
+            ax.axhline(0, color='black', linewidth=1)
+            ax.legend()
+
+        canvas = FigureCanvas(fig)
+        layout.addWidget(canvas)
+
+        button_layout = QHBoxLayout()
+        button_style = """
+            QPushButton {
+                background-color: #004d73;
+                color: white;
+                padding: 10px 24px;
+                border: none;
+                border-radius: 5px;
+                font-size: 16px;
+            }
+            QPushButton:hover {
+                background-color: #003d61;
+            }
+            """
+
+        # Back button - navigate to the Monte Carlo results
+        back_button = QPushButton('Back', self)
+        back_button.setStyleSheet(button_style)
+        back_button.clicked.connect(self.go_back)
+        button_layout.addWidget(back_button)
+
+        home_button = QPushButton('Go to Home', self)
+        home_button.setStyleSheet(button_style)
+        home_button.clicked.connect(self.go_to_page_0)
+        button_layout.addWidget(home_button)
+
+        layout.addLayout(button_layout)
+        self.setLayout(layout)
+
+    def go_back(self):
+        while self.stacked_widget.currentIndex() + 1 < self.stacked_widget.count():
+            self.stacked_widget.removeWidget(self.stacked_widget.widget(self.stacked_widget.currentIndex() + 1))
+        self.stacked_widget.setCurrentIndex(self.stacked_widget.currentIndex() - 1)
+
+    def go_to_page_0(self):
+        self.stacked_widget.setCurrentIndex(1)
+
+
+# Main Application Class with Stacked Widget
+class MainWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Heat Recovery Factor Tool")
+        self.setFixedSize(1000, 900)
+        self.initUI()
+
+    def initUI(self):
+        main_layout = QVBoxLayout()
+        top_layout = QHBoxLayout()
+        spacer = QWidget(self)
+        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        top_layout.addWidget(spacer)
+
+        logo_label = QLabel(self)
+        pixmap = QPixmap('Logo.jpeg')
+
+        pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        logo_label.setPixmap(pixmap)
+        logo_label.setAlignment(Qt.AlignTop | Qt.AlignRight)
+
+        top_layout.addWidget(logo_label)
+
+        main_layout.addLayout(top_layout)
+        self.stacked_widget = QStackedWidget()
+
+        # Create instances of the pages
+        self.splash_screen = SplashScreen(self.stacked_widget)
+        self.landing_page = LandingPage(self.stacked_widget)
+        self.prediction_page = PredictionApp(self.stacked_widget)
+        self.prediction_page1 = PredictionApp1(self.stacked_widget)
+        self.distrbutionType_page = Page2DistributionType(self.stacked_widget)
+
+        # Add the pages to the QStackedWidget
+        self.stacked_widget.addWidget(self.splash_screen)  # Logo screen
+        self.stacked_widget.addWidget(self.landing_page)  # Index 1
+        self.stacked_widget.addWidget(self.prediction_page)  # Index 2
+        self.stacked_widget.addWidget(self.prediction_page1)  # Index 3
+        self.stacked_widget.addWidget(self.distrbutionType_page)  # Index 4
+
+        # Main layout
+        main_layout.addWidget(self.stacked_widget)
+        self.setLayout(main_layout)
+
+    def closeEvent(self, event):
+        # Stop the Monte Carlo simulations still running before the window is destroyed
+        for worker in list(running_workers):
+            worker.requestInterruption()
+            worker.wait()
+        super().closeEvent(event)
@@ -0,0 +1,115 @@
+"""
+==========================================================
+Sampling
+input distributions of the Monte Carlo simulation, sampled
+by inverting their CDF at pseudo-random or scrambled
+Sobol and Halton (quasi-Monte Carlo) points
+==========================================================
+"""
+import numpy as np
+
+
+# Function to calculate mean and standard deviation for normal distribution approximation
+def calculate_mean_std(min_val, max_val):
+    mean = (min_val + max_val) / 2
+    std_dev = (max_val - min_val) / 6  # Approximation
+    return mean, std_dev
+
+
+# Shared random generator of the Monte Carlo simulation. Pass an own Generator, e.g. np.random.default_rng(seed),
+# for reproducible samples
+rng = np.random.default_rng()
+
+# Points the samples are mapped from: pseudo-random or scrambled quasi-random (QMC) sequences
+sampling_methods = ['random', 'sobol', 'halton']
+
+
+def unit_samples(n_samples, n_dims, method='random', generator=None):
+    # (n_samples, n_dims) points in the unit hypercube. Sobol points are rounded down to a power of two, which
+    # keeps their balance properties
+    generator = rng if generator is None else generator
+    if method == 'random':
+        return generator.random((n_samples, n_dims))
+    from scipy.stats import qmc
+    if method == 'sobol':
+        return qmc.Sobol(n_dims, scramble=True, seed=generator).random_base2(int(np.floor(np.log2(max(n_samples, 1)))))
+    if method == 'halton':
+        return qmc.Halton(n_dims, scramble=True, seed=generator).random(n_samples)
+    raise ValueError(f"Unsupported sampling method '{method}'")
+
+
+def sequence_points(n_dims, method, seed, start, n_samples):
+    # Points start to start + n_samples of the sequence given by seed (a SeedSequence), for evaluating one sequence
+    # in independent chunks. The quasi-random sequences are skipped ahead, pseudo-random chunks need a seed of
+    # their own (e.g. spawned from one SeedSequence) and ignore start. The generator is seeded with the state of
+    # the SeedSequence, the QMC engines spawn from the SeedSequence of their generator otherwise
+    generator = np.random.default_rng(seed.generate_state(4))
+    if method == 'random':
+        return generator.random((n_samples, n_dims))
+    from scipy.stats import qmc
+    if method == 'sobol':
+        engine = qmc.Sobol(n_dims, scramble=True, seed=generator)
+    elif method == 'halton':
+        engine = qmc.Halton(n_dims, scramble=True, seed=generator)
+    else:
+        raise ValueError(f"Unsupported sampling method '{method}'")
+    if start:
+        engine.fast_forward(start)
+    return engine.random(n_samples)
+
+
+def truncated_normal(a, b, u):
+    # Standard normal truncated to [a, b] at the probabilities u. Intervals right of the mean are mapped
+    # mirrored, so the CDF is evaluated where it does not round to 1
+    from scipy.special import ndtr, ndtri
+    if a > 0:
+        return -truncated_normal(-b, -a, 1 - u)
+    low, high = ndtr(a), ndtr(b)
+    return np.clip(ndtri(low + (high - low) * u), a, b)
+
+
+# Function to map probabilities u in [0, 1) through the inverse CDF of a distribution type
+def inverse_cdf(dist_type, mean, std, min_val, max_val, mode, u):
+    u = np.asarray(u, dtype=float)
+    if dist_type == 'normal':
+        a, b = (min_val - mean) / std, (max_val - mean) / std
+        return mean + std * truncated_normal(a, b, u)
+    elif dist_type == 'uniform':
+        return min_val + (max_val - min_val) * u
+    elif dist_type == 'triangular':
+        width = max_val - min_val
+        return np.where(u < (mode - min_val) / width, min_val + np.sqrt(u * width * (mode - min_val)),
+                        max_val - np.sqrt((1 - u) * width * (max_val - mode)))
+    elif dist_type == 'exponential':
+        # Only samples above the threshold are kept, the exponential distribution is memoryless so these are
+        # the threshold plus an exponential sample with the same mean
+        threshold = 5
+        return threshold - mean * np.log1p(-u)
+    elif dist_type == 'lognormal':
+        shape = std  # shape parameter (σ)
+        scale = mean  # scale parameter (exp(μ))
+        # Normal distribution of log(x), truncated to the limits
+        with np.errstate(divide='ignore'):
+            a, b = (np.log([max(min_val, 0), max_val]) - np.log(scale)) / shape
+        return scale * np.exp(shape * truncated_normal(a, b, u))
+    else:
+        raise ValueError("Unsupported distribution type")
+
+
+# Function to generate samples based on distribution type, every distribution is sampled exactly in one pass
+def get_samples(dist_type, mean, std, min_val, max_val, mode, n_samples, generator=None):
+    generator = rng if generator is None else generator
+    return inverse_cdf(dist_type, mean, std, min_val, max_val, mode, generator.random(n_samples))
+
+
+def sample_inputs(ranges, n_samples, method='random', generator=None):
+    # Samples of every parameter, ranges is {parameter: {'dist_type': ..., 'mean', 'std', 'min', 'max', 'mode'}}
+    # as entered in the GUI. Each parameter is mapped from its own dimension of the (quasi-)random points
+    return map_inputs(ranges, unit_samples(n_samples, len(ranges), method, generator))
+
+
+def map_inputs(ranges, points):
+    # Maps column i of the unit hypercube points through the inverse CDF of parameter i
+    return {param: inverse_cdf(params['dist_type'], params.get('mean'), params.get('std'), params.get('min'),
+                               params.get('max'), params.get('mode'), points[:, i])
+            for i, (param, params) in enumerate(ranges.items())}
@@ -0,0 +1,214 @@
+"""
+==========================================================
+Statistical Analysis GUI
+in this section a graphical user interface will be generated
+to use the summary table of the campaign to perform screening
+analysis for the desired response in a desired operational year
+==========================================================
+"""
+import matplotlib.pyplot as plt
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QPalette, QColor, QPixmap
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QLabel, QPushButton, QComboBox, QStackedWidget, QMessageBox,
+                             QHBoxLayout, QSizePolicy)
+
+from fates.analysis import critical_t_value, response_column, screening_regression
+from fates.gui import SplashScreen
+from fates.postprocessing import load_summary
+
+
+class LandingPage(QWidget):
+    def __init__(self, stacked_widget):
+        super().__init__()
+        self.stacked_widget = stacked_widget
+
+        self.setAutoFillBackground(True)
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor("#001f3f"))
+        palette.setColor(QPalette.WindowText, Qt.white)
+        palette.setColor(QPalette.Button, QColor("#004d73"))
+        palette.setColor(QPalette.ButtonText, Qt.white)
+        self.setPalette(palette)
+
+        layout = QVBoxLayout()
+        title_label = QLabel("FATES\n"
+                             "(Feasibility Assessment of Thermal Energy Storage)")
+        title_label.setFont(QFont("Arial", 40, QFont.Bold))
+        title_label.setAlignment(Qt.AlignCenter)
+        title_label.setStyleSheet("color: white;")  # White title text
+        layout.addWidget(title_label)
+
+        # Label for response type
+        response_label = QLabel("Please select the response")
+        response_label.setFont(QFont("Arial", 14))
+        response_label.setAlignment(Qt.AlignCenter)
+        response_label.setStyleSheet("color: white;")
+        layout.addWidget(response_label, alignment=Qt.AlignCenter)
+
+        # Dropdown for response type
+        self.response_dropdown = QComboBox()
+        self.response_dropdown.addItems(["Heat Recovery Factor", "Heat Production"])
+        self.response_dropdown.setFixedWidth(1000)
+        self.response_dropdown.setStyleSheet("""
+                    QComboBox {
+                        padding: 5px;
+                        border: 1px solid #004d73;
+                        border-radius: 4px;
+                        min-width: 100px;
+                        text-align: center;
+                        background-color: #003c54;
+                        color: white;
+                    }
+                    QComboBox::drop-down {
+                        subcontrol-origin: padding;
+                        subcontrol-position: top right;
+                        width: 0px; 
+                    }
+                    QComboBox::down-arrow {
+                        image: none;
+                    }
+                """)
+        layout.addWidget(self.response_dropdown, alignment=Qt.AlignCenter)
+
+        # Label for year of operation
+        year_label = QLabel("Please select the desired year for analysis")
+        year_label.setFont(QFont("Arial", 14))
+        year_label.setAlignment(Qt.AlignCenter)
+        year_label.setStyleSheet("color: white;")
+        layout.addWidget(year_label, alignment=Qt.AlignCenter)
+
+        # Dropdown for year of operation
+        self.year_dropdown = QComboBox()
+        self.year_dropdown.addItems([f"{year}" for year in range(2, 11)])  # Years 2 to 10
+        self.year_dropdown.setFixedWidth(300)
+        self.year_dropdown.setStyleSheet("""
+                    QComboBox {
+                        padding: 5px;
+                        border: 1px solid #004d73;
+                        border-radius: 4px;
+                        min-width: 100px;
+                        text-align: center;
+                        background-color: #003c54;
+                        color: white;
+                    }
+                    QComboBox::drop-down {
+                        subcontrol-origin: padding;
+                        subcontrol-position: top right;
+                        width: 0px; 
+                    }
+                    QComboBox::down-arrow {
+                        image: none;
+                    }
+                """)
+        layout.addWidget(self.year_dropdown, alignment=Qt.AlignCenter)
+
+        # Analyze button
+        analyze_button = QPushButton("Analyze")
+        analyze_button.setFont(QFont("Arial", 14))
+        analyze_button.setFixedWidth(300)
+        analyze_button.setStyleSheet("background-color: #004d73; color: white;")
+        analyze_button.clicked.connect(self.perform_analysis)
+        layout.addWidget(analyze_button, alignment=Qt.AlignCenter)
+
+        self.setLayout(layout)
+
+    def perform_analysis(self):
+        selected_response = self.response_dropdown.currentText()
+        selected_year = self.year_dropdown.currentText()
+
+        self.analyze_data(response_column(selected_response, selected_year))
+
+    def analyze_data(self, column_name):
+        df = load_summary()
+
+        # Find column index by name
+        if column_name not in df.columns:
+            QMessageBox.critical(self, "Error", f"Column '{column_name}' not found in data.")
+            return
+
+        # Perform OLS regression
+        model, response_data = screening_regression(df, column_name)
+
+        print(model.summary())
+
+        # Plot Q-Q and residual plots
+        self.plot_qq(model)
+        self.plot_residuals(model)
+        self.plot_pareto_chart(model, response_data)
+
+    def plot_qq(self, model):
+        import statsmodels.api as sm
+        fig, ax = plt.subplots(figsize=(8, 6))
+        sm.qqplot(model.resid, line='s', ax=ax)
+        ax.set_xlabel('Theoretical Quantiles')
+        ax.set_ylabel('Sample Quantiles')
+        plt.show()
+
+    def plot_residuals(self, model):
+        y_pred = model.fittedvalues
+        fig, ax = plt.subplots(figsize=(8, 6))
+        ax.scatter(y_pred, model.resid, s=20, c='blue', alpha=0.6)
+        ax.axhline(y=0, color='red', linestyle='--', linewidth=2)
+        ax.set_xlabel('Predicted Values')
+        ax.set_ylabel('Residuals')
+        plt.show()
+
+    def plot_pareto_chart(self, model, response_data):
+        t_critical = critical_t_value(model, response_data)
+        print("t-critical:", t_critical)
+
+        standardized_coeffs = model.params[1:] / model.bse[1:]
+        sorted_coeffs = standardized_coeffs.abs().sort_values(ascending=True)
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+        ax.barh(sorted_coeffs.index, sorted_coeffs, color='blue', alpha=0.7)
+        ax.axvline(x=t_critical, color='red', linestyle='--', label=f't-critical = {t_critical:.4f}')
+
+        significant_level = model.params[model.pvalues == 0.05]
+        for level in significant_level:
+            ax.axvline(x=abs(level), color='red', linestyle='--')
+
+        ax.set_ylabel('Parameter')
+        ax.set_xlabel('t_value')
+        ax.legend()
+        plt.tight_layout()
+        plt.show()
+
+
+class MainWindow(QWidget):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Heat Recovery Factor Tool")
+        self.setFixedSize(1000, 500)
+        self.initUI()
+
+    def initUI(self):
+        main_layout = QVBoxLayout()
+        top_layout = QHBoxLayout()
+        spacer = QWidget(self)
+        spacer.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Minimum)
+        top_layout.addWidget(spacer)
+
+        logo_label = QLabel(self)
+        pixmap = QPixmap('Logo.jpeg')
+
+        pixmap = pixmap.scaled(100, 100, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        logo_label.setPixmap(pixmap)
+        logo_label.setAlignment(Qt.AlignTop | Qt.AlignRight)
+
+        top_layout.addWidget(logo_label)
+
+        main_layout.addLayout(top_layout)
+        self.stacked_widget = QStackedWidget()
+
+        # Create instances of the pages
+        self.splash_screen = SplashScreen(self.stacked_widget)
+        self.landing_page = LandingPage(self.stacked_widget)
+
+        # Add the pages to the QStackedWidget
+        self.stacked_widget.addWidget(self.splash_screen)  # Logo screen
+        self.stacked_widget.addWidget(self.landing_page)  # Index 1
+
+        # Main layout
+        main_layout.addWidget(self.stacked_widget)
+        self.setLayout(main_layout)
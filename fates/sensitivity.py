@@ -0,0 +1,73 @@
+"""
+==========================================================
+Sensitivity
+global sensitivity analysis of the proxy models. The
+first-order (S1) and total-effect (ST) Sobol indices of
+every input are estimated for HRF and E of one or more
+years from two independent sample matrices A and B and
+the matrices AB_i (A with column i taken from B), which
+takes (inputs + 2) * n_samples proxy evaluations per
+response, all in one batch. S1 uses the estimator of
+Saltelli et al. (2010), ST the one of Jansen (1999).
+Their confidence intervals are percentile bootstrap
+intervals over the sample rows, which are conservative
+for quasi-random points.
+==========================================================
+"""
+import numpy as np
+
+from fates.proxy import evaluate_proxy, get_compiled_model
+from fates.sampling import map_inputs, unit_samples
+
+
+def sobol_terms(f_A, f_B, f_AB):
+    # Terms of every sample row whose means give the variance and the indices, f_AB holds one row per input
+    return np.column_stack([f_A, f_B, f_A ** 2, f_B ** 2, (f_B * (f_AB - f_A)).T, ((f_A - f_AB) ** 2).T])
+
+
+def sobol_estimates(means, n_inputs):
+    # S1 and ST of every input from the means of the sobol_terms, which are on the last axis
+    mean = (means[..., 0] + means[..., 1]) / 2
+    variance = ((means[..., 2] + means[..., 3]) / 2 - mean ** 2)[..., None]
+    return means[..., 4:4 + n_inputs] / variance, 0.5 * means[..., 4 + n_inputs:] / variance
+
+
+def run_sensitivity(ranges, year_numbers, n_samples=2 ** 14, method='sobol', n_bootstrap=200, confidence=0.95,
+                    seed=None):
+    # ranges as for sample_inputs, year_numbers is one year or a list of them. Returns {response: {input:
+    # {'S1': (value, low, high), 'ST': (value, low, high)}}} for the responses HRF<year> and E<year>
+    year_numbers = [year_numbers] if np.isscalar(year_numbers) else list(year_numbers)
+    generator = np.random.default_rng(seed)
+    n_inputs = len(ranges)
+    points = unit_samples(n_samples, 2 * n_inputs, method, generator)
+    n = len(points)
+    A, B = points[:, :n_inputs], points[:, n_inputs:]
+    AB = np.tile(A, (n_inputs, 1))
+    for i in range(n_inputs):
+        AB[i * n:(i + 1) * n, i] = B[:, i]
+    X = np.column_stack(list(map_inputs(ranges, np.vstack([A, B, AB])).values()))
+
+    alpha = (1 - confidence) / 2
+    block = max(1, 2 ** 22 // n)  # resamples per block of the bootstrap
+    indices = {}
+    for year_number in year_numbers:
+        for target in ['HRF', 'E']:
+            f = evaluate_proxy(get_compiled_model(year_number, target), X)
+            f -= f[:2 * n].mean()  # centred, which lowers the variance of the S1 estimator
+            terms = sobol_terms(f[:n], f[n:2 * n], f[2 * n:].reshape(n_inputs, n))
+            S1, ST = sobol_estimates(terms.mean(axis=0), n_inputs)
+
+            # Bootstrap, a resample is a row of how often every sample row is drawn, so the means of the terms of
+            # a block of resamples are one matrix product
+            means = []
+            for start in range(0, n_bootstrap, block):
+                rows = generator.integers(0, n, (min(block, n_bootstrap - start), n))
+                counts = np.bincount((rows + n * np.arange(len(rows))[:, None]).ravel(), minlength=rows.size)
+                means.append(counts.reshape(rows.shape) @ terms / n)
+            S1_boot, ST_boot = sobol_estimates(np.vstack(means), n_inputs)
+            S1_low, S1_high = np.quantile(S1_boot, [alpha, 1 - alpha], axis=0)
+            ST_low, ST_high = np.quantile(ST_boot, [alpha, 1 - alpha], axis=0)
+            indices[f'{target}{year_number}'] = {
+                param: {'S1': (S1[i], S1_low[i], S1_high[i]), 'ST': (ST[i], ST_low[i], ST_high[i])}
+                for i, param in enumerate(ranges)}
+    return indices
@@ -0,0 +1,179 @@
+"""
+==========================================================
+Simulation
+runs OGS for a prepared experiment as a child process and
+extracts the averaged well time series. Extracted results
+are stored in a local cache shared by all campaigns,
+keyed by the hash of the ATES.prj template and of every
+resolved prj, mesh and initial condition value of an
+experiment. Least recently used entries are evicted when
+the cache exceeds 'cache_size'.
+==========================================================
+"""
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+from fates import config
+
+
+def cache_key(parameters):
+    with open(os.path.join(config.directory, config.project), 'rb') as file:
+        template_hash = hashlib.sha256(file.read()).hexdigest()
+    content = json.dumps({'template': template_hash, 'parameters': parameters}, sort_keys=True)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def cache_load(key):
+    path = os.path.join(config.cache_dir, key + '.npz')
+    if not os.path.exists(path):
+        update_cache_stats(misses=1)
+        return None
+    os.utime(path)  # Marks the entry as recently used
+    update_cache_stats(hits=1)
+    with np.load(path) as results:
+        return {name: results[name].tolist() for name in results.files}
+
+
+def cache_store(key, output):
+    os.makedirs(config.cache_dir, exist_ok=True)
+    temporary_path = os.path.join(config.cache_dir, key + '.tmp.npz')
+    np.savez(temporary_path, **{name: np.asarray(value) for name, value in output.items()})
+    os.replace(temporary_path, os.path.join(config.cache_dir, key + '.npz'))
+    evict_cache()
+
+
+def cache_entries():
+    if not os.path.exists(config.cache_dir):
+        return []
+    entries = [os.path.join(config.cache_dir, name) for name in os.listdir(config.cache_dir)
+               if name.endswith('.npz') and not name.endswith('.tmp.npz')]
+    return sorted(entries, key=os.path.getmtime)
+
+
+def evict_cache():
+    entries = cache_entries()
+    total_size = sum(os.path.getsize(entry) for entry in entries)
+    evictions = 0
+    while total_size > config.cache_size and entries:
+        entry = entries.pop(0)
+        total_size -= os.path.getsize(entry)
+        os.remove(entry)
+        evictions += 1
+    if evictions:
+        update_cache_stats(evictions=evictions)
+
+
+def read_cache_stats():
+    stats_path = os.path.join(config.cache_dir, 'stats.json')
+    if not os.path.exists(stats_path):
+        return {'hits': 0, 'misses': 0, 'evictions': 0}
+    with open(stats_path) as file:
+        return json.load(file)
+
+
+def update_cache_stats(**counts):
+    os.makedirs(config.cache_dir, exist_ok=True)
+    stats = read_cache_stats()
+    for name, count in counts.items():
+        stats[name] += count
+    stats_path = os.path.join(config.cache_dir, 'stats.json')
+    with open(stats_path + '.tmp', 'w') as file:
+        json.dump(stats, file)
+    os.replace(stats_path + '.tmp', stats_path)
+
+
+def cache_report():
+    stats = read_cache_stats()
+    entries = cache_entries()
+    total_size = sum(os.path.getsize(entry) for entry in entries)
+    lookups = stats['hits'] + stats['misses']
+    print(f"Result cache {config.cache_dir}: {len(entries)} entries, {total_size / 1024 ** 2:.1f} of "
+          f"{config.cache_size / 1024 ** 2:.0f} MB, {stats['hits']} hits, {stats['misses']} misses "
+          f"({stats['hits'] / max(lookups, 1):.0%} hit rate), {stats['evictions']} evictions")
+
+
+async def stream_log(index, process, log):
+    # Copies the OGS output to the log file and reports every 10 % of simulated time
+    reported = 0
+    async for line in process.stdout:
+        log.write(line)
+        match = re.search(rb'and time ([0-9.eE+-]+)', line)
+        if match and int(10 * float(match.group(1)) / config.sim_time) > reported:
+            reported = int(10 * float(match.group(1)) / config.sim_time)
+            print(f"Experiment {index}: {10 * reported}% simulated")
+
+
+async def simulate_experiment(index, context, semaphore):
+    # ----------------------------------------------------
+    # Running The Simulator
+    # paths are absolute and OGS writes to the output folder
+    # given by '-o', so the working directory is never changed
+    # ----------------------------------------------------
+    ogs_path = os.path.join(config.ogs_exe, 'ogs.exe' if sys.platform == 'win32' else 'ogs')
+    async with semaphore:
+        start = time.perf_counter()
+        with open(context['log_file'], 'wb') as log:
+            process = await asyncio.create_subprocess_exec(
+                ogs_path, context['project_file'], '-o', context['output_dir'],
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+                env=dict(os.environ, OMP_NUM_THREADS=str(config.ogs_threads)))
+            try:
+                await asyncio.wait_for(stream_log(index, process, log), timeout=config.ogs_timeout)
+                await process.wait()
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise RuntimeError(f"OGS exceeded the time limit of {config.ogs_timeout} s")
+        if process.returncode != 0:
+            raise RuntimeError(f"OGS failed with exit code {process.returncode}, see {context['log_file']}")
+        print(f"Experiment {index}: simulated in {time.perf_counter() - start:.0f} s")
+
+
+def extract_results(context, mesh):
+    # ----------------------------------------------------
+    # Saving Output Data
+    # the wells are placed in the geometry of the mesh
+    # ----------------------------------------------------
+    import vtuIO
+    h = mesh['h']
+    n_z = mesh['n_z']
+    aquifer_depth = mesh['aquifer_depth']
+    dip_rad = math.radians(mesh['dip'])
+    c = math.cos(dip_rad)
+    s = math.sin(dip_rad)
+    simulation_pvd = vtuIO.PVDIO(filename=context['pvd_file'], dim=3)
+    hot_point = {}
+    for i in range(n_z + 1):
+        hot_point[f"pt{i}"] = (-250 * c, 0, (-1 * aquifer_depth) - (i * (h / n_z)) - 250 * s)
+    cold_point = {}
+    for i in range(n_z + 1):
+        cold_point[f"pt{i}"] = (250 * c, 0, (-1 * aquifer_depth) - (i * (h / n_z)) + 250 * s)
+    T_result_hot = {}
+    T_result_cold = {}
+    P_result_hot = {}
+    P_result_cold = {}
+    T_result_hot["Temperature"] = simulation_pvd.read_time_series(fieldname="T", pts=hot_point)
+    T_result_cold["Temperature"] = simulation_pvd.read_time_series(fieldname="T", pts=cold_point)
+    P_result_hot["Pressure"] = simulation_pvd.read_time_series(fieldname="p", pts=hot_point)
+    P_result_cold["Pressure"] = simulation_pvd.read_time_series(fieldname="p", pts=cold_point)
+    T_results_hot = [sum(column) / len(column) for column in zip(*T_result_hot["Temperature"].values())]
+    T_results_cold = [sum(column) / len(column) for column in zip(*T_result_cold["Temperature"].values())]
+    P_results_hot = [sum(column) / len(column) for column in zip(*P_result_hot["Pressure"].values())]
+    P_results_cold = [sum(column) / len(column) for column in zip(*P_result_cold["Pressure"].values())]
+    times = list(simulation_pvd.timesteps)
+
+    return {
+        'times': times,
+        'T_hot': T_results_hot,
+        'T_cold': T_results_cold,
+        'P_hot': P_results_hot,
+        'P_cold': P_results_cold
+    }
@@ -0,0 +1,156 @@
+"""
+==========================================================
+Streaming Statistics
+summaries of values that arrive in chunks, so the memory
+does not grow with their number. A summary holds the
+count, mean and sum of squared deviations (merged with
+the parallel form of Welford's algorithm by Chan et al.),
+min and max, a fixed-bin histogram over a range set from
+the first values with counts of the values below and
+above it, and fine histograms over narrow windows around
+the percentiles of interest. Quantiles are read from the
+finest histogram holding them, so their resolution is
+the window width divided by the number of bins. Merging
+two summaries gives the summary of all their values.
+==========================================================
+"""
+import numpy as np
+
+
+def histogram_edges(values, bins):
+    # (low, high, bins) of a histogram covering values with a margin of 10 % of their span on both sides
+    low, high = values.min(), values.max()
+    margin = 0.1 * (high - low) if high > low else 1e-6 * max(abs(low), 1)
+    return (low - margin, high + margin, bins)
+
+
+def quantile_windows(values, fractions, bins, width=0.05):
+    # (low, high, bins) of the fine histograms around the quantiles at the fractions, each window holds the
+    # fractions +- width of values. The true quantiles lie well inside for a few thousand values
+    windows = []
+    for fraction in fractions:
+        low, high = np.quantile(values, [max(fraction - width, 0), min(fraction + width, 1)])
+        if high > low:
+            windows.append((low, high, bins))
+    return windows
+
+
+def histogram_counts(values, edges):
+    # Counts of the values in the bins of edges = (low, high, bins), values outside are not counted
+    low, high, bins = edges
+    index = np.floor((values - low) * (bins / (high - low))).astype(np.int64)
+    return np.bincount(index[(index >= 0) & (index < bins)], minlength=bins)
+
+
+def summarize(values, edges, windows=()):
+    # Summary of one chunk of values. Values outside the histogram are only counted in below and above
+    mean = values.mean()
+    counts = histogram_counts(values, edges)
+    below = int(np.count_nonzero(values < edges[0]))
+    return {
+        'count': len(values),
+        'mean': mean,
+        'm2': ((values - mean) ** 2).sum(),
+        'min': values.min(),
+        'max': values.max(),
+        'edges': edges,
+        'counts': counts,
+        'below': below,
+        'above': len(values) - below - int(counts.sum()),
+        'windows': [{'edges': window, 'below': int(np.count_nonzero(values < window[0])),
+                     'counts': histogram_counts(values, window)} for window in windows]
+    }
+
+
+def merge_summaries(a, b):
+    # Summary of the values of both summaries, built with the same edges and windows
+    count = a['count'] + b['count']
+    delta = b['mean'] - a['mean']
+    return {
+        'count': count,
+        'mean': a['mean'] + delta * b['count'] / count,
+        'm2': a['m2'] + b['m2'] + delta ** 2 * a['count'] * b['count'] / count,
+        'min': min(a['min'], b['min']),
+        'max': max(a['max'], b['max']),
+        'edges': a['edges'],
+        'counts': a['counts'] + b['counts'],
+        'below': a['below'] + b['below'],
+        'above': a['above'] + b['above'],
+        'windows': [{'edges': window_a['edges'], 'below': window_a['below'] + window_b['below'],
+                     'counts': window_a['counts'] + window_b['counts']}
+                    for window_a, window_b in zip(a['windows'], b['windows'])]
+    }
+
+
+def summary_bins(summary, bins=None):
+    # Counts and edges of the histogram, merged into bins bins if given. Bins can only be merged, never split, so
+    # there are at most as many as in the summary. The values below and above its range get an outer bin each when
+    # there are any, the outer edges are the smallest and largest value
+    low, high, n_bins = summary['edges']
+    index = np.linspace(0, n_bins, min(bins or n_bins, n_bins) + 1).astype(int)
+    counts = np.add.reduceat(summary['counts'], index[:-1])
+    edges = np.clip(np.linspace(low, high, n_bins + 1)[index], summary['min'], summary['max'])
+    if summary['below']:
+        counts, edges = np.concatenate([[summary['below']], counts]), np.concatenate([[summary['min']], edges])
+    if summary['above']:
+        counts, edges = np.concatenate([counts, [summary['above']]]), np.concatenate([edges, [summary['max']]])
+    edges[0], edges[-1] = summary['min'], summary['max']
+    return counts, edges
+
+
+def interpolate_ranks(counts, edges, cumulative, targets):
+    # Values at the target ranks, interpolated linearly within the bins. cumulative[i] is the rank at edges[i]
+    i = np.clip(np.searchsorted(cumulative, targets), 1, len(counts))  # bin i - 1 holds the target
+    within = (targets - cumulative[i - 1]) / np.maximum(counts[i - 1], 1)
+    return edges[i - 1] + np.clip(within, 0, 1) * (edges[i] - edges[i - 1])
+
+
+def summary_quantiles(summary, fractions):
+    # Values below which the fractions of the values lie, from the finest histogram holding them
+    targets = np.asarray(fractions, dtype=float) * summary['count']
+    counts, edges = summary_bins(summary)
+    quantiles = interpolate_ranks(counts, edges, np.concatenate([[0], np.cumsum(counts)]), targets)
+    for window in summary['windows']:
+        cumulative = window['below'] + np.concatenate([[0], np.cumsum(window['counts'])])
+        inside = (targets > cumulative[0]) & (targets <= cumulative[-1])
+        if inside.any():
+            low, high, bins = window['edges']
+            quantiles[inside] = interpolate_ranks(window['counts'], np.linspace(low, high, bins + 1), cumulative,
+                                                  targets[inside])
+    return quantiles
+
+
+def summary_histogram(summary, bins, density=False):
+    # Counts (or probability densities) and edges of the histogram merged into bins bins, for plotting
+    counts, edges = summary_bins(summary, bins)
+    if not density:
+        return counts, edges
+    widths = np.diff(edges)
+    return np.divide(counts, summary['count'] * widths, out=np.zeros(len(counts)), where=widths > 0), edges
+
+
+def summary_cdf(summary):
+    # Values and cumulative probabilities at the bin edges
+    counts, edges = summary_bins(summary)
+    return edges, np.concatenate([[0], np.cumsum(counts)]) / summary['count']
+
+
+def summary_kde(summary, bandwidth=None):
+    # Gaussian kernel density estimate at the centres of the histogram bins, the counts are convolved with the
+    # kernel by FFT. The bandwidth defaults to Scott's rule (std * n ** -1/5). Values outside the histogram are
+    # left out, they would pile up at its ends
+    low, high, bins = summary['edges']
+    width = (high - low) / bins
+    bandwidth = summary_std(summary) * summary['count'] ** -0.2 if bandwidth is None else bandwidth
+    if not bandwidth > 0 or summary['min'] == summary['max']:
+        bandwidth = width  # constant values, drawn as a kernel one bin wide
+    # Offsets beyond 40 bandwidths have a weight of 0 anyway, clipping them keeps narrow kernels from overflowing
+    kernel = np.exp(-0.5 * np.minimum(np.abs(width * np.arange(-bins, bins + 1) / bandwidth), 40) ** 2)
+    kernel /= kernel.sum() * width
+    n_fft = 2 ** int(np.ceil(np.log2(3 * bins + 1)))  # no wrap-around of the full convolution
+    density = np.fft.irfft(np.fft.rfft(summary['counts'], n_fft) * np.fft.rfft(kernel, n_fft), n_fft)
+    return low + width * (np.arange(bins) + 0.5), np.maximum(density[bins:2 * bins], 0) / summary['count']
+
+
+def summary_std(summary):
+    return np.sqrt(summary['m2'] / (summary['count'] - 1)) if summary['count'] > 1 else np.nan